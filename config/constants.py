@@ -151,6 +151,9 @@ VALIDATION_TIMES_HISTORY_SIZE = 10
 # System resource update interval
 SYSTEM_RESOURCE_UPDATE_INTERVAL_SECONDS = 30
 
+# Reuse memory/temperature readings taken within this window
+METRICS_CACHE_TTL_SECONDS = 1.0
+
 # Shared metrics file staleness threshold
 METRICS_FILE_MAX_AGE_SECONDS = 120  # 2 minutes
 
@@ -158,6 +161,15 @@ METRICS_FILE_MAX_AGE_SECONDS = 120  # 2 minutes
 METRICS_INITIAL_SAVE_DELAY_SECONDS = 30
 METRICS_SAVE_INTERVAL_SECONDS = 15
 
+# Rewrite unchanged metrics at least this often so readers don't see a stale file
+METRICS_MAX_CLEAN_SAVE_INTERVAL_SECONDS = 60
+
+# Full JSON metrics rewrite interval; hot health fields go to the binary snapshot every save
+METRICS_JSON_SAVE_INTERVAL_SECONDS = 60
+
+# tmpfs directory for the binary health snapshot shared with the web interface
+METRICS_SHM_DIR = '/dev/shm'
+
 # =============================================================================
 # NETWORK MONITOR CONSTANTS
 # =============================================================================
@@ -165,8 +177,17 @@ METRICS_SAVE_INTERVAL_SECONDS = 15
 # Network connectivity check settings
 NETWORK_MAX_RETRIES = 5
 NETWORK_CHECK_INTERVAL_SECONDS = 30
+NETWORK_MAX_CHECK_INTERVAL_SECONDS = 60  # Backoff ceiling while stable; also the worst-case outage detection delay
 NETWORK_REQUEST_TIMEOUT_SECONDS = 5
 
+# Host probed for connectivity (TCP connect only) and how long to cache its address
+NETWORK_CHECK_HOST = 'api-v3.mbta.com'
+NETWORK_CHECK_PORT = 443
+NETWORK_DNS_CACHE_SECONDS = 3600  # 1 hour
+
+# Wireless interface restarted on connection loss
+WIFI_INTERFACE_NAME = 'wlan0'
+
 # WiFi interface restart timing
 WIFI_INTERFACE_DOWN_WAIT_SECONDS = 1
 WIFI_INTERFACE_UP_WAIT_SECONDS = 5
@@ -228,6 +249,27 @@ API_KEY_MIN_LENGTH = 32
 # Web server port
 WEB_SERVER_PORT = 8000
 
+# Gunicorn worker processes, threads per worker and HTTP keep-alive
+WEB_SERVER_WORKERS = 2
+WEB_SERVER_THREADS = 4
+WEB_SERVER_KEEPALIVE_SECONDS = 30
+
+# Reuse health/performance metrics across web requests within this window
+WEB_METRICS_CACHE_TTL_SECONDS = 0.5
+
+# How often /status_stream checks for a changed system status (a keep-alive
+# comment is written on unchanged ticks so closed tabs are noticed quickly)
+WEB_STATUS_STREAM_INTERVAL_SECONDS = 1
+
+# Each open stream holds a server thread, so streams end after this long (the
+# browser reconnects on its own) and each worker serves at most this many at
+# once, leaving the rest of its WEB_SERVER_THREADS for ordinary requests
+WEB_STATUS_STREAM_MAX_SECONDS = 60
+WEB_STATUS_STREAM_MAX_CLIENTS = 2
+
+# Delay the browser waits before reopening a stream that ended, in milliseconds
+WEB_STATUS_STREAM_RETRY_MS = 1000
+
 # =============================================================================
 # STATUS CHECK CONSTANTS
 # =============================================================================
@@ -2,6 +2,7 @@
 import json
 import os
 import logging
+import threading
 from typing import Dict, Any
 from dotenv import load_dotenv
 from .validation import validate_settings, DEFAULT_SETTINGS
@@ -46,6 +47,19 @@ class SettingsManager:
             
         self.last_modified = None
         
+        # Bumped whenever the loaded settings may have changed, so callers can
+        # cache values derived from them
+        self.version = 0
+        self._version_mtime = None
+        
+        # Parsed settings served by get_current_settings until the file changes,
+        # and the version they were loaded at
+        self._cached_settings = None
+        self._cached_mtime_ns = None
+        self._cached_version = None
+        # Keeps the cache, the version and the file consistent across web server threads
+        self._lock = threading.RLock()
+        
         # Use the centralized DEFAULT_SETTINGS from validation.py
         self._default_settings = DEFAULT_SETTINGS.copy()
     
@@ -135,12 +149,24 @@ class SettingsManager:
             # Validate settings
             settings = validate_settings(settings, self._default_settings)
             self.last_modified = os.path.getmtime(self.env_file)
+            self._bump_version(self.last_modified)
             return settings
 
         except Exception as e:
             logger.error(f"Error loading settings: {e}")
+            self._bump_version(None)
             return self.get_default_settings()
     
+    def _bump_version(self, mtime: float | None) -> None:
+        """Increment the settings version if the file changed since it was last seen.
+        
+        Args:
+            mtime: Modification time of the loaded file, or None if loading failed
+        """
+        if mtime != self._version_mtime:
+            self._version_mtime = mtime
+            self.version += 1
+    
     def save_settings(self, settings: Dict[str, Any]) -> bool:
         """Save settings to .env file.
         
@@ -150,47 +176,52 @@ class SettingsManager:
         Returns:
             bool: True if save successful, False otherwise
         """
-        try:
-            # Validate settings before saving
-            settings_dict = validate_settings(settings, self._default_settings)
-            
-            # Preserve certain settings that shouldn't be overwritten from web interface
-            # These are settings that are not configurable from the web UI
-            # 'route' is set during initial setup and should not be changed via web interface
-            preserve_keys = ['route', 'show_debugger_options', 'save_error_data']
-            
-            # Load current settings to preserve values for non-web-configurable settings
-            if os.path.exists(self.env_file):
-                current_settings = self.load_settings()
-                for preserve_key in preserve_keys:
-                    if preserve_key in current_settings:
-                        # Preserve the existing value instead of using the default
-                        settings_dict[preserve_key] = current_settings[preserve_key]
-            
-            # Create backup of existing .env file
-            if os.path.exists(self.env_file):
-                backup_file = f"{self.env_file}.bak"
-                try:
-                    with open(self.env_file, 'r') as src, open(backup_file, 'w') as dst:
-                        dst.write(src.read())
-                except Exception as e:
-                    logger.warning(f"Failed to create .env backup: {e}")
-            
-            # Save to .env file
-            with open(self.env_file, 'w') as f:
-                for key, value in settings_dict.items():
-                    if isinstance(value, (list, dict)):
-                        value = json.dumps(value)
-                    elif isinstance(value, bool):
-                        value = 'true' if value else 'false'
-                    f.write(f'{key.upper()}={value}\n')
-            
-            self.last_modified = os.path.getmtime(self.env_file)
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error saving settings: {e}")
-            return False
+        with self._lock:
+            try:
+                # Validate settings before saving
+                settings_dict = validate_settings(settings, self._default_settings)
+                
+                # Preserve certain settings that shouldn't be overwritten from web interface
+                # These are settings that are not configurable from the web UI
+                # 'route' is set during initial setup and should not be changed via web interface
+                preserve_keys = ['route', 'show_debugger_options', 'save_error_data']
+                
+                # Load current settings to preserve values for non-web-configurable settings
+                if os.path.exists(self.env_file):
+                    current_settings = self.load_settings()
+                    for preserve_key in preserve_keys:
+                        if preserve_key in current_settings:
+                            # Preserve the existing value instead of using the default
+                            settings_dict[preserve_key] = current_settings[preserve_key]
+                
+                # Create backup of existing .env file
+                if os.path.exists(self.env_file):
+                    backup_file = f"{self.env_file}.bak"
+                    try:
+                        with open(self.env_file, 'r') as src, open(backup_file, 'w') as dst:
+                            dst.write(src.read())
+                    except Exception as e:
+                        logger.warning(f"Failed to create .env backup: {e}")
+                
+                # Save to .env file
+                with open(self.env_file, 'w') as f:
+                    for key, value in settings_dict.items():
+                        if isinstance(value, (list, dict)):
+                            value = json.dumps(value)
+                        elif isinstance(value, bool):
+                            value = 'true' if value else 'false'
+                        f.write(f'{key.upper()}={value}\n')
+                
+                self.last_modified = os.path.getmtime(self.env_file)
+                # Saves can land within the mtime granularity, so always bump
+                self.version += 1
+                self._version_mtime = self.last_modified
+                self._cached_settings = None
+                return True
+                
+            except Exception as e:
+                logger.error(f"Error saving settings: {e}")
+                return False
     
     def check_and_reload(self) -> Dict[str, Any] | None:
         """Check if settings file has been modified and reload if needed.
@@ -212,6 +243,37 @@ class SettingsManager:
             logger.error(f"Error checking settings: {e}")
             return self.get_default_settings()
     
+    def get_current_settings(self) -> Dict[str, Any]:
+        """Get the current settings, re-parsing the .env file only when it has changed.
+        
+        A single stat of the file decides whether the cached settings are still
+        fresh; save_settings drops the cache so its own writes are always seen.
+        
+        Returns:
+            Dictionary containing current settings
+        """
+        return self.get_versioned_settings()[0]
+    
+    def get_versioned_settings(self) -> tuple[Dict[str, Any], int]:
+        """Get the current settings together with the version they were loaded at.
+        
+        Returns:
+            Tuple of (settings dictionary, settings version), read atomically so
+            values derived from the settings can be cached under that version
+        """
+        with self._lock:
+            try:
+                mtime_ns = os.stat(self.env_file).st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            
+            if self._cached_settings is None or mtime_ns != self._cached_mtime_ns:
+                self._cached_settings = self.load_settings()
+                self._cached_mtime_ns = mtime_ns
+                self._cached_version = self.version
+            
+            return self._cached_settings.copy(), self._cached_version
+    
     def force_reload(self) -> Dict[str, Any]:
         """Force reload settings from .env file, ignoring modification time checks.
         
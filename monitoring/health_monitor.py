@@ -3,11 +3,15 @@
 import time
 import logging
 import subprocess
-import requests
+import json
+import http.client
+from urllib.parse import urlsplit
 from datetime import datetime, timedelta
 import os
 import sys
-from logging.handlers import RotatingFileHandler
+import queue
+import atexit
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 
 # Add project root to path for imports when run as a script
 def _get_project_root():
@@ -35,18 +39,24 @@ from config.constants import (
 
 # Configure logging with smaller file size
 # Note: No StreamHandler - when running via systemd, stdout is captured by journalctl
+# Records are queued and written by a background listener so that log rotation on
+# the SD card never stalls the health check loop.
 os.makedirs('logs', exist_ok=True)
+_file_handler = RotatingFileHandler(
+    'logs/system_health.log',
+    maxBytes=LOG_FILE_MAX_BYTES_SMALL,  # 512KB instead of 1MB
+    backupCount=LOG_FILE_BACKUP_COUNT_SMALL,      # Keep fewer backups
+    encoding='utf-8'
+)
+_file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+_log_queue = queue.Queue(-1)
+_log_listener = QueueListener(_log_queue, _file_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        RotatingFileHandler(
-            'logs/system_health.log',
-            maxBytes=LOG_FILE_MAX_BYTES_SMALL,  # 512KB instead of 1MB
-            backupCount=LOG_FILE_BACKUP_COUNT_SMALL,      # Keep fewer backups
-            encoding='utf-8'
-        )
-    ]
+    format='%(message)s',  # The listener's file handler applies the real format
+    handlers=[QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
@@ -56,10 +66,27 @@ class SystemHealthService:
     def __init__(self):
         """Initialize the system health service."""
         self.health_url = f'http://localhost:{WEB_SERVER_PORT}/health'
+        # Parse the constant URL once instead of on every probe
+        parts = urlsplit(self.health_url)
+        self._host, self._port, self._path = parts.hostname, parts.port, parts.path or '/'
         self.last_reboot = datetime.now()
         self.unhealthy_since = None
         self.consecutive_failures = 0
     
+    def _get_health(self) -> tuple:
+        """Request the display service health endpoint.
+        
+        Returns:
+            tuple: (HTTP status code, response body bytes)
+        """
+        conn = http.client.HTTPConnection(self._host, self._port, timeout=NETWORK_REQUEST_TIMEOUT_SECONDS)
+        try:
+            conn.request('GET', self._path)
+            response = conn.getresponse()
+            return response.status, response.read()
+        finally:
+            conn.close()
+    
     def check_health(self) -> bool:
         """Check system health status.
         
@@ -67,10 +94,10 @@ class SystemHealthService:
             bool: True if system is healthy
         """
         try:
-            response = requests.get(self.health_url, timeout=NETWORK_REQUEST_TIMEOUT_SECONDS)
-            health_data = response.json()
+            status_code, body = self._get_health()
+            health_data = json.loads(body)
             
-            if response.status_code == 200 and health_data.get('healthy', False):
+            if status_code == 200 and health_data.get('healthy', False):
                 # Log recovery if we were previously unhealthy
                 if self.unhealthy_since is not None:
                     recovery_time = datetime.now() - self.unhealthy_since
@@ -146,11 +173,11 @@ class SystemHealthService:
         
         while waited < max_wait:
             try:
-                response = requests.get(self.health_url, timeout=NETWORK_REQUEST_TIMEOUT_SECONDS)
-                if response.status_code in (200, 503):  # 503 is unhealthy but reachable
+                status_code, _ = self._get_health()
+                if status_code in (200, 503):  # 503 is unhealthy but reachable
                     logger.info(f"Display service is ready after {waited}s")
                     return True
-            except requests.exceptions.ConnectionError:
+            except ConnectionError:
                 # Service not yet available, this is expected during startup
                 pass
             except Exception as e:
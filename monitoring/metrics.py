@@ -5,9 +5,12 @@ import threading
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 from collections import deque
-import json
+from array import array
+import orjson
+import math
+import mmap
 import os
-import fcntl  # For file locking
+import struct
 from dotenv import load_dotenv
 from config.bedtime import is_mbta_quiet_hours
 from config.constants import (
@@ -21,14 +24,239 @@ from config.constants import (
     HEALTH_CHECK_LED_TIMEOUT_MINUTES,
     METRICS_INITIAL_SAVE_DELAY_SECONDS,
     METRICS_SAVE_INTERVAL_SECONDS,
+    METRICS_MAX_CLEAN_SAVE_INTERVAL_SECONDS,
+    METRICS_JSON_SAVE_INTERVAL_SECONDS,
+    METRICS_SHM_DIR,
 )
-from .system_utils import get_memory_usage, get_cpu_temperature
+from .system_utils import collect_all
+
+try:
+    # Optional: kernel change notifications for the shared metrics file
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:
+    INotify = None
 
 logger = logging.getLogger(__name__)
 
+# Error categories tracked by SystemMetrics, in counter-array order
+ERROR_TYPES = ('api_errors', 'validation_errors', 'led_errors', 'process_crashes')
+_ERROR_INDEX = {name: idx for idx, name in enumerate(ERROR_TYPES)}
+
+# Fixed layout of the binary health snapshot shared with reader processes:
+# written_at, last_api_success, last_led_update (wall-clock seconds, 0.0 = never),
+# api_healthy, led_healthy, is_quiet_hours, active_vehicles, avg_api_latency_ms,
+# avg_update_time_ms, session_start, first_start (wall-clock seconds, 0.0 = unknown),
+# memory total/used/free MB (total 0 = unavailable), memory percent_used,
+# cpu_temperature (NaN = unavailable), then one counter per ERROR_TYPES entry.
+# Everything the status displays lives here, so readers never mix it with the
+# less frequently rewritten JSON file.
+_HEALTH_SNAPSHOT = struct.Struct('<3d???I2d2d3I2d%dQ' % len(ERROR_TYPES))
+
+# The snapshot is mapped into both processes behind a sequence counter: the
+# writer makes it odd while updating and even when done, and readers retry
+# if it was odd or changed across their copy (a seqlock, so no torn reads).
+_SNAPSHOT_SEQ = struct.Struct('<Q')
+_SNAPSHOT_SIZE = _SNAPSHOT_SEQ.size + _HEALTH_SNAPSHOT.size
+_SNAPSHOT_READ_RETRIES = 3
+
+
+def _read_snapshot_fields(snapshot) -> Optional[tuple]:
+    """Copy the health snapshot fields out of a mapping under the seqlock.
+    
+    Args:
+        snapshot: Mapping of at least _SNAPSHOT_SIZE bytes
+        
+    Returns:
+        tuple of _HEALTH_SNAPSHOT fields, or None if never written or busy
+    """
+    for _ in range(_SNAPSHOT_READ_RETRIES):
+        seq = _SNAPSHOT_SEQ.unpack_from(snapshot, 0)[0]
+        if seq == 0 or seq & 1:
+            # Never written, or the writer is mid-update
+            continue
+        fields = _HEALTH_SNAPSHOT.unpack_from(snapshot, _SNAPSHOT_SEQ.size)
+        if _SNAPSHOT_SEQ.unpack_from(snapshot, 0)[0] == seq:
+            return fields
+    return None
+
+
+def _decode_health_snapshot(fields: tuple) -> tuple:
+    """Turn snapshot fields into health status entries.
+    
+    Uptimes are left out because they advance between writes; add them with
+    _with_uptimes() at read time.
+    
+    Args:
+        fields: tuple of _HEALTH_SNAPSHOT fields
+        
+    Returns:
+        tuple: (written_at, session_start, first_start, health dict)
+    """
+    (written_at, api_ts, led_ts, api_healthy, led_healthy, is_quiet_hours,
+     active_vehicles, avg_api_latency, avg_update_time, session_start, first_start,
+     mem_total, mem_used, mem_free, mem_percent, cpu_temperature, *errors) = fields
+    
+    health = {
+        'timestamp': datetime.fromtimestamp(written_at).isoformat(),
+        'healthy': api_healthy and led_healthy,
+        'api_healthy': api_healthy,
+        'led_healthy': led_healthy,
+        'is_quiet_hours': is_quiet_hours,
+        'active_vehicles': active_vehicles,
+        'avg_api_latency_ms': round(avg_api_latency, 2),
+        'avg_update_time_ms': round(avg_update_time, 2),
+        'error_counts': dict(zip(ERROR_TYPES, errors)),
+        'last_api_success': datetime.fromtimestamp(api_ts).isoformat() if api_ts else None,
+        'last_led_update': datetime.fromtimestamp(led_ts).isoformat() if led_ts else None,
+        'session_start_time': datetime.fromtimestamp(session_start).isoformat() if session_start else None,
+        'first_start_time': datetime.fromtimestamp(first_start).isoformat() if first_start else None,
+        'memory_usage': {
+            'total_mb': mem_total,
+            'used_mb': mem_used,
+            'free_mb': mem_free,
+            'percent_used': mem_percent
+        } if mem_total else None,
+        'cpu_temperature': None if math.isnan(cpu_temperature) else cpu_temperature,
+    }
+    return written_at, session_start, first_start, health
+
+
+def _with_uptimes(health: Dict, session_start: float, first_start: float) -> Dict:
+    """Copy a decoded snapshot health dict with uptimes as of now.
+    
+    Args:
+        health: Health dict from _decode_health_snapshot()
+        session_start: Wall-clock session start, 0.0 if unknown
+        first_start: Wall-clock first start, 0.0 if unknown
+        
+    Returns:
+        Dict: New health dict including session/total uptime seconds
+    """
+    now = time.time()
+    health = dict(health)
+    health['session_uptime_seconds'] = int(now - session_start) if session_start else 0
+    health['total_uptime_seconds'] = int(now - first_start) if first_start else 0
+    return health
+
+
+def read_health_snapshot(metrics_file: str) -> Optional[tuple]:
+    """Read the writer's health snapshot once, for one-shot tools like status_check.
+    
+    Args:
+        metrics_file: Path of the JSON metrics file the writer uses
+        
+    Returns:
+        tuple: (written_at wall-clock seconds, health dict), or None if unavailable
+    """
+    try:
+        fd = os.open(SystemMetrics._snapshot_path(metrics_file), os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        if os.fstat(fd).st_size < _SNAPSHOT_SIZE:
+            return None
+        with mmap.mmap(fd, _SNAPSHOT_SIZE, access=mmap.ACCESS_READ) as snapshot:
+            fields = _read_snapshot_fields(snapshot)
+    finally:
+        os.close(fd)
+    if fields is None:
+        return None
+    written_at, session_start, first_start, health = _decode_health_snapshot(fields)
+    return written_at, _with_uptimes(health, session_start, first_start)
+
+
+class RollingStats:
+    """Fixed-size rolling window with O(1) average, min and max.
+    
+    Samples live in a preallocated array('d') ring, the running sum is adjusted
+    as samples enter and leave the window, and min/max are tracked with
+    monotonic deques of (sample index, value) pairs.
+    """
+    
+    def __init__(self, maxlen: int):
+        """Initialize the rolling window.
+        
+        Args:
+            maxlen: Number of most recent samples to keep
+        """
+        self._maxlen = maxlen
+        self._buf = array('d', [0.0] * maxlen)
+        self._sum = 0.0
+        self._count = 0  # Total samples ever appended (index of the next sample)
+        self._min_q = deque()  # Increasing values; head is the window minimum
+        self._max_q = deque()  # Decreasing values; head is the window maximum
+    
+    def append(self, value: float) -> None:
+        """Add a sample, evicting the oldest one if the window is full."""
+        buf = self._buf
+        maxlen = self._maxlen
+        idx = self._count
+        slot = idx % maxlen
+        if idx >= maxlen:
+            self._sum -= buf[slot]
+        buf[slot] = value
+        self._sum += value
+        self._count += 1
+        
+        # Recompute once per window to stop floating point drift from accumulating
+        # (unused slots are still 0.0, so summing the whole ring is exact)
+        if slot == 0:
+            self._sum = sum(buf)
+        
+        oldest = idx - min(self._count, maxlen) + 1
+        
+        min_q = self._min_q
+        while min_q and min_q[-1][1] >= value:
+            min_q.pop()
+        min_q.append((idx, value))
+        if min_q[0][0] < oldest:
+            min_q.popleft()
+        
+        max_q = self._max_q
+        while max_q and max_q[-1][1] <= value:
+            max_q.pop()
+        max_q.append((idx, value))
+        if max_q[0][0] < oldest:
+            max_q.popleft()
+    
+    def __len__(self) -> int:
+        return min(self._count, self._maxlen)
+    
+    @property
+    def avg(self) -> float:
+        """Average of the samples in the window, or 0 if empty."""
+        return self._sum / len(self) if self._count else 0
+    
+    @property
+    def min(self) -> float:
+        """Smallest sample in the window."""
+        return self._min_q[0][1]
+    
+    @property
+    def max(self) -> float:
+        """Largest sample in the window."""
+        return self._max_q[0][1]
+    
+    def summary(self) -> Dict:
+        """Get avg/min/max/sample count for the window."""
+        return {
+            'avg': round(self.avg, 2),
+            'min': round(self.min, 2),
+            'max': round(self.max, 2),
+            'samples': len(self)
+        }
+
 class SystemMetrics:
     """Tracks system performance metrics and health indicators."""
     
+    # Recording methods replaced with _noop on reader instances
+    _RECORD_METHODS = (
+        'record_api_latency', 'record_stream_activity', 'record_update_time',
+        'record_led_update', 'record_validation_time', 'record_error',
+        'record_vehicle_update', 'update_active_vehicles',
+    )
+    _noop = staticmethod(lambda *args, **kwargs: None)
+    
     def __init__(self, metrics_file: str = 'logs/metrics.json', is_writer: bool = False):
         """Initialize the metrics tracker.
         
@@ -37,28 +265,30 @@ class SystemMetrics:
             is_writer: Whether this instance writes metrics (True for display controller, False for website)
         """
         self.metrics_file = metrics_file
+        self._snapshot_file = self._snapshot_path(metrics_file)
+        self._snapshot_map: Optional[mmap.mmap] = None
+        self._snapshot_ino: Optional[int] = None  # Inode of the mapped file, to spot a recreated one
+        self._snapshot_seq = 0
         self.is_writer = is_writer
         self._lock = threading.Lock()
         
         # Uptime tracking - use system boot time instead of instance start time
         self._first_start_file = 'logs/first_start.json'
-        self._first_start_time = self._load_or_create_first_start()
+        self._first_start_cache: Optional[datetime] = None  # Loaded on first access
         
         # Performance metrics - reduced history size
-        self._api_latency = deque(maxlen=API_LATENCY_HISTORY_SIZE)    # Last 20 API response times
-        self._update_times = deque(maxlen=UPDATE_TIMES_HISTORY_SIZE)    # Last 20 LED update times
-        self._validation_times = deque(maxlen=VALIDATION_TIMES_HISTORY_SIZE) # Last 10 validation times
+        self._api_latency = RollingStats(API_LATENCY_HISTORY_SIZE)    # Last 20 API response times
+        self._update_times = RollingStats(UPDATE_TIMES_HISTORY_SIZE)    # Last 20 LED update times
+        self._validation_times = RollingStats(VALIDATION_TIMES_HISTORY_SIZE) # Last 10 validation times
         
         # Health metrics
-        self._error_counts: Dict[str, int] = {
-            'api_errors': 0,
-            'validation_errors': 0,
-            'led_errors': 0,
-            'process_crashes': 0
-        }
-        self._last_api_success: Optional[datetime] = None
-        self._last_led_update: Optional[datetime] = None
-        self._last_vehicle_data: Optional[datetime] = None  # Track when we last received vehicle data
+        # Timestamps are updated with single GIL-atomic stores so the record_* hot
+        # path never has to take the lock; error counters are read-modify-write and
+        # are incremented under it. Timestamps are monotonic seconds (0.0 = never)
+        # and are converted to datetimes only on read.
+        self._error_counts = array('Q', [0] * len(ERROR_TYPES))
+        self._last_api_success_ts = array('d', [0.0])
+        self._last_led_update_ts = array('d', [0.0])
         
         # System resource metrics
         self._memory_usage: Optional[Dict] = None
@@ -67,18 +297,42 @@ class SystemMetrics:
         
         # Vehicle metrics - minimal tracking
         self._active_vehicles = 0
-        self._last_vehicle_update = None
+        # Last vehicle event stored as scalars; the dict is only built on read
+        self._last_vehicle_id: Optional[str] = None
+        self._last_vehicle_status: Optional[str] = None
+        self._last_vehicle_data_ts = 0.0  # Monotonic time we last received vehicle data
+        
+        # Reader-side cache of the last parsed shared metrics: (mtime_ns, health dict)
+        self._shared_health_cache: Optional[tuple] = None
+        # With inotify the cache is trusted until the writer replaces the file,
+        # so the request path does no stat at all
+        self._shared_json_watched = False
+        self._shared_json_changed = True
+        # Reader-side merged health: (snapshot written_at, JSON health dict, merged dict,
+        # session start, first start)
+        self._snapshot_health_cache: Optional[tuple] = None
+        
+        # Cached .env location and display mode, refreshed when the file's mtime changes
+        self._env_path: Optional[str] = None
+        self._env_mtime: Optional[int] = None
+        self._env_display_mode = 'unknown'
+        
+        # Set by record_* methods so unchanged metrics are not rewritten every cycle
+        self._dirty = False
         
         # Start periodic save only for writer instances
-        self._should_run = True
+        self._stop_event = threading.Event()
         if self.is_writer:
+            # Create the metrics directory once rather than on every save
+            os.makedirs(os.path.dirname(self.metrics_file) or '.', exist_ok=True)
             self._save_thread = threading.Thread(target=self._periodic_save, daemon=True)
             self._save_thread.start()
         else:
             self._save_thread = None
-            # Reader instances should not create empty metrics files
-            self._last_api_success = None
-            self._last_led_update = None
+            # Reader instances don't record data - swap recorders for a no-op
+            for name in self._RECORD_METHODS:
+                setattr(self, name, self._noop)
+            self._start_shared_json_watch()
     
     def _get_system_boot_time(self) -> Optional[datetime]:
         """Get the system boot time from /proc/uptime.
@@ -98,6 +352,13 @@ class SystemMetrics:
             logger.warning(f"Could not determine system boot time: {e}")
             return None
     
+    @property
+    def _first_start_time(self) -> datetime:
+        """First start timestamp, loaded from disk on first access."""
+        if self._first_start_cache is None:
+            self._first_start_cache = self._load_or_create_first_start()
+        return self._first_start_cache
+    
     def _load_or_create_first_start(self) -> datetime:
         """Load or create the first start timestamp.
         
@@ -105,25 +366,25 @@ class SystemMetrics:
             datetime: The timestamp when the system was first started
         """
         try:
-            # Ensure logs directory exists
-            os.makedirs('logs', exist_ok=True)
-            
             # Try to load existing first start time
-            if os.path.exists(self._first_start_file):
-                with open(self._first_start_file, 'r') as f:
-                    data = json.load(f)
-                    first_start_str = data.get('first_start_time')
-                    if first_start_str:
-                        return datetime.fromisoformat(first_start_str)
+            try:
+                with open(self._first_start_file, 'rb') as f:
+                    data = orjson.loads(f.read())
+                first_start_str = data.get('first_start_time')
+                if first_start_str:
+                    return datetime.fromisoformat(first_start_str)
+            except FileNotFoundError:
+                pass
             
             # If file doesn't exist or is invalid, create it with current time
             first_start = datetime.now()
             if self.is_writer:  # Only writer should create this file
-                with open(self._first_start_file, 'w') as f:
-                    json.dump({
+                os.makedirs(os.path.dirname(self._first_start_file), exist_ok=True)
+                with open(self._first_start_file, 'wb') as f:
+                    f.write(orjson.dumps({
                         'first_start_time': first_start.isoformat(),
                         'note': 'This file tracks when the MBTA LED Controller was first deployed'
-                    }, f, indent=2)
+                    }, option=orjson.OPT_INDENT_2))
                 logger.info(f"Created first start timestamp: {first_start.isoformat()}")
             
             return first_start
@@ -135,11 +396,10 @@ class SystemMetrics:
     
     def record_api_latency(self, latency_ms: float) -> None:
         """Record API response latency."""
-        if not self.is_writer:
-            return  # Reader instances don't record data
+        self._dirty = True
         with self._lock:
             self._api_latency.append(latency_ms)
-            self._last_api_success = datetime.now()
+        self._last_api_success_ts[0] = time.monotonic()
     
     def record_stream_activity(self) -> None:
         """Record activity from the SSE stream (data received or event).
@@ -154,15 +414,12 @@ class SystemMetrics:
         4+ hours even though the connection is perfectly healthy. Health checks account
         for this by using extended timeouts during quiet hours.
         """
-        if not self.is_writer:
-            return  # Reader instances don't record data
-        with self._lock:
-            self._last_api_success = datetime.now()
+        self._dirty = True
+        self._last_api_success_ts[0] = time.monotonic()
     
     def record_update_time(self, update_ms: float) -> None:
         """Record LED update time."""
-        if not self.is_writer:
-            return  # Reader instances don't record data
+        self._dirty = True
         with self._lock:
             self._update_times.append(update_ms)
             # Don't update _last_led_update here - that's handled by record_led_update()
@@ -173,42 +430,35 @@ class SystemMetrics:
         This method updates the last_led_update timestamp whenever LEDs are updated,
         even when the update doesn't go through the normal update_display flow.
         """
-        if not self.is_writer:
-            return  # Reader instances don't record data
-        with self._lock:
-            self._last_led_update = datetime.now()
+        self._dirty = True
+        self._last_led_update_ts[0] = time.monotonic()
     
     def record_validation_time(self, validation_ms: float) -> None:
         """Record data validation time."""
-        if not self.is_writer:
-            return  # Reader instances don't record data
+        self._dirty = True
         with self._lock:
             self._validation_times.append(validation_ms)
     
     def record_error(self, error_type: str) -> None:
         """Record an error occurrence."""
-        if not self.is_writer:
-            return  # Reader instances don't record data
-        with self._lock:
-            if error_type in self._error_counts:
-                self._error_counts[error_type] += 1
+        self._dirty = True
+        idx = _ERROR_INDEX.get(error_type)
+        if idx is not None:
+            with self._lock:
+                self._error_counts[idx] += 1
     
     def record_vehicle_update(self, vehicle_id: str, status: str) -> None:
         """Record a vehicle update."""
-        if not self.is_writer:
-            return  # Reader instances don't record data
+        self._dirty = True
+        now = time.monotonic()
         with self._lock:
-            self._last_vehicle_data = datetime.now()  # Track when we received vehicle data
-            self._last_vehicle_update = {
-                'timestamp': datetime.now().isoformat(),
-                'vehicle_id': vehicle_id,
-                'status': status
-            }
+            self._last_vehicle_id = vehicle_id
+            self._last_vehicle_status = status
+            self._last_vehicle_data_ts = now  # Track when we received vehicle data
     
     def update_active_vehicles(self, count: int) -> None:
         """Update count of active vehicles."""
-        if not self.is_writer:
-            return  # Reader instances don't record data
+        self._dirty = True
         with self._lock:
             self._active_vehicles = count
     
@@ -218,10 +468,10 @@ class SystemMetrics:
         Returns:
             timedelta if vehicle data has been received, None otherwise
         """
-        with self._lock:
-            if self._last_vehicle_data is None:
-                return None
-            return datetime.now() - self._last_vehicle_data
+        last_ts = self._last_vehicle_data_ts
+        if not last_ts:
+            return None
+        return timedelta(seconds=time.monotonic() - last_ts)
     
     def _get_current_display_mode(self) -> str:
         """Read the current display mode from the .env file.
@@ -230,24 +480,38 @@ class SystemMetrics:
             str: The current display mode, or 'unknown' if unable to read
         """
         try:
-            # Try to find the .env file in common locations
-            possible_env_paths = [
-                '.env',  # Current working directory
-                os.path.join(os.getcwd(), '.env'),  # Explicit current directory
-                os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env'),  # Project root
-            ]
-            
-            env_file = None
-            for path in possible_env_paths:
-                if os.path.exists(path):
-                    env_file = path
+            if self._env_path is None:
+                # Try to find the .env file in common locations
+                possible_env_paths = [
+                    '.env',  # Current working directory
+                    os.path.join(os.getcwd(), '.env'),  # Explicit current directory
+                    os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env'),  # Project root
+                ]
+                
+                for path in possible_env_paths:
+                    try:
+                        mtime = os.stat(path).st_mtime_ns
+                    except OSError:
+                        continue
+                    self._env_path = path
                     break
+                else:
+                    return 'unknown'
+            else:
+                try:
+                    mtime = os.stat(self._env_path).st_mtime_ns
+                except FileNotFoundError:
+                    # File went away; search again on the next call
+                    self._env_path = None
+                    self._env_mtime = None
+                    return 'unknown'
             
-            if not env_file:
-                return 'unknown'
+            if mtime == self._env_mtime:
+                return self._env_display_mode
             
             # Read the .env file directly to get current display mode
-            with open(env_file, 'r') as f:
+            display_mode = 'unknown'
+            with open(self._env_path, 'r') as f:
                 for line in f:
                     line = line.strip()
                     if line.startswith('DISPLAY_MODE='):
@@ -258,13 +522,31 @@ class SystemMetrics:
                             value = value[1:-1]
                         elif value.startswith("'") and value.endswith("'"):
                             value = value[1:-1]
-                        return value.lower()
+                        display_mode = value.lower()
+                        break
             
-            return 'unknown'
+            self._env_mtime = mtime
+            self._env_display_mode = display_mode
+            return display_mode
         except Exception as e:
             logger.debug(f"Could not read display mode from .env: {e}")
             return 'unknown'
     
+    def _mono_to_datetime(self, mono_ts: float) -> Optional[datetime]:
+        """Convert a monotonic timestamp to a wall-clock datetime.
+        
+        Args:
+            mono_ts: Value from time.monotonic(), or 0.0 if never recorded
+            
+        Returns:
+            datetime: Corresponding local time, or None if never recorded
+        """
+        if not mono_ts:
+            return None
+        # Offset taken now rather than at startup, so an NTP step after boot
+        # (no RTC on the Pi) doesn't leave every timestamp skewed
+        return datetime.fromtimestamp(mono_ts + time.time() - time.monotonic())
+    
     def _update_system_resources(self) -> None:
         """Update system resource metrics if needed."""
         if not self.is_writer:
@@ -274,15 +556,16 @@ class SystemMetrics:
         # Update every 30 seconds
         if (self._last_resource_check is None or 
             now - self._last_resource_check > timedelta(seconds=SYSTEM_RESOURCE_UPDATE_INTERVAL_SECONDS)):
-            self._memory_usage = get_memory_usage()
-            self._cpu_temperature = get_cpu_temperature()
+            resources = collect_all()
+            self._memory_usage = resources['memory_usage']
+            self._cpu_temperature = resources['cpu_temperature']
             self._last_resource_check = now
     
     def get_health_status(self) -> Dict:
         """Get current system health status."""
-        with self._lock:
-            # If this is a reader instance (website), always try to load from shared file first
-            if not self.is_writer:
+        # If this is a reader instance (website), always try to load from shared file first
+        if not self.is_writer:
+            with self._lock:  # Guards the reader-side caches
                 shared_health = self._load_shared_health()
                 if shared_health:
                     return shared_health
@@ -299,108 +582,119 @@ class SystemMetrics:
                         'display_mode': display_mode,
                         'avg_api_latency_ms': 0,
                         'avg_update_time_ms': 0,
-                        'error_counts': {'api_errors': 0, 'validation_errors': 0, 'led_errors': 0, 'process_crashes': 0},
+                        'error_counts': dict.fromkeys(ERROR_TYPES, 0),
                         'last_api_success': None,
                         'last_led_update': None,
                         'note': 'No shared metrics available - display controller may not be running'
                     }
                     return default_health
-            
-            # Use local metrics for writer instances
-            now = datetime.now()
-            
-            # Get system boot time (session start = last reboot)
-            system_boot = self._get_system_boot_time()
-            
-            # Check if we're in MBTA quiet hours (late night when service is minimal/off)
-            is_quiet_hours = is_mbta_quiet_hours()
-            
-            # Adjust health check thresholds based on time of day
-            # Note: sseclient does NOT expose SSE comment lines (": keep-alive"), so during
-            # quiet hours when no trains run, we won't get any events for extended periods (4+ hours)
-            # even though the TCP connection is alive. We adjust timeouts to reflect this reality.
-            if is_quiet_hours:
-                api_timeout = timedelta(hours=HEALTH_CHECK_QUIET_HOURS_TIMEOUT_HOURS)  # Assume healthy during entire quiet hours period
-                led_timeout = timedelta(hours=HEALTH_CHECK_QUIET_HOURS_TIMEOUT_HOURS)  # LED updates not expected during quiet hours
-            else:
-                api_timeout = timedelta(minutes=HEALTH_CHECK_API_TIMEOUT_MINUTES)  # Normal hours: expect regular vehicle updates
-                led_timeout = timedelta(minutes=HEALTH_CHECK_LED_TIMEOUT_MINUTES)  # Normal hours: expect regular LED updates
-            
-            # Check API health - MBTA API calls happen when events occur, not continuously
-            # For SSE streams, we track any event from the iterator to monitor connection health
-            api_healthy = (
-                self._last_api_success is not None and
-                (now - self._last_api_success) < api_timeout
-            )
-            
-            # Check LED update health - LEDs update when vehicles change, not continuously
-            # During quiet hours, if API is healthy (stream connected), LED health is less critical
-            # since no trains running = no LED updates is expected behavior
-            if is_quiet_hours and api_healthy:
-                led_healthy = True
-            else:
-                # Normal hours or API unhealthy: require recent LED updates
-                led_healthy = (
-                    self._last_led_update is not None and
-                    (now - self._last_led_update) < led_timeout
-                )
-            
-            # Calculate average latencies - only if we have data
-            avg_api_latency = (
-                sum(self._api_latency) / len(self._api_latency)
-                if self._api_latency else 0
-            )
-            avg_update_time = (
-                sum(self._update_times) / len(self._update_times)
-                if self._update_times else 0
+        
+        # Use local metrics for writer instances. Slow work (file reads, resource
+        # refresh) happens outside the lock; only the field snapshot is taken under it.
+        now = datetime.now()
+        now_mono = time.monotonic()
+        last_api_success_ts = self._last_api_success_ts[0]
+        last_led_update_ts = self._last_led_update_ts[0]
+        
+        # Get system boot time (session start = last reboot)
+        system_boot = self._get_system_boot_time()
+        
+        # Check if we're in MBTA quiet hours (late night when service is minimal/off)
+        is_quiet_hours = is_mbta_quiet_hours()
+        
+        # Adjust health check thresholds based on time of day
+        # Note: sseclient does NOT expose SSE comment lines (": keep-alive"), so during
+        # quiet hours when no trains run, we won't get any events for extended periods (4+ hours)
+        # even though the TCP connection is alive. We adjust timeouts to reflect this reality.
+        if is_quiet_hours:
+            api_timeout = timedelta(hours=HEALTH_CHECK_QUIET_HOURS_TIMEOUT_HOURS)  # Assume healthy during entire quiet hours period
+            led_timeout = timedelta(hours=HEALTH_CHECK_QUIET_HOURS_TIMEOUT_HOURS)  # LED updates not expected during quiet hours
+        else:
+            api_timeout = timedelta(minutes=HEALTH_CHECK_API_TIMEOUT_MINUTES)  # Normal hours: expect regular vehicle updates
+            led_timeout = timedelta(minutes=HEALTH_CHECK_LED_TIMEOUT_MINUTES)  # Normal hours: expect regular LED updates
+        
+        # Check API health - MBTA API calls happen when events occur, not continuously
+        # For SSE streams, we track any event from the iterator to monitor connection health
+        api_healthy = bool(
+            last_api_success_ts and
+            (now_mono - last_api_success_ts) < api_timeout.total_seconds()
+        )
+        
+        # Check LED update health - LEDs update when vehicles change, not continuously
+        # During quiet hours, if API is healthy (stream connected), LED health is less critical
+        # since no trains running = no LED updates is expected behavior
+        if is_quiet_hours and api_healthy:
+            led_healthy = True
+        else:
+            # Normal hours or API unhealthy: require recent LED updates
+            led_healthy = bool(
+                last_led_update_ts and
+                (now_mono - last_led_update_ts) < led_timeout.total_seconds()
             )
-            
-            # Calculate uptime in seconds - use system boot time for accurate session tracking
-            if system_boot:
-                session_uptime_seconds = int((now - system_boot).total_seconds())
-                session_start_iso = system_boot.isoformat()
-            else:
-                # Fallback if we can't read system boot time
-                session_uptime_seconds = 0
-                session_start_iso = None
-            
-            total_uptime_seconds = int((now - self._first_start_time).total_seconds())
-            
-            # Get current display mode from settings
-            display_mode = self._get_current_display_mode()
-            
-            # Update system resources
-            self._update_system_resources()
-            
-            health_status = {
-                'timestamp': now.isoformat(),
-                'healthy': api_healthy and led_healthy,
-                'api_healthy': api_healthy,
-                'led_healthy': led_healthy,
-                'is_quiet_hours': is_quiet_hours,
-                'active_vehicles': self._active_vehicles,
-                'display_mode': display_mode,
-                'avg_api_latency_ms': round(avg_api_latency, 2),
-                'avg_update_time_ms': round(avg_update_time, 2),
-                'error_counts': self._error_counts.copy(),
-                'last_api_success': (
-                    self._last_api_success.isoformat()
-                    if self._last_api_success else None
-                ),
-                'last_led_update': (
-                    self._last_led_update.isoformat()
-                    if self._last_led_update else None
-                ),
-                'session_uptime_seconds': session_uptime_seconds,
-                'total_uptime_seconds': total_uptime_seconds,
-                'session_start_time': session_start_iso,
-                'first_start_time': self._first_start_time.isoformat(),
-                'memory_usage': self._memory_usage,
-                'cpu_temperature': self._cpu_temperature
-            }
-            
-            return health_status
-    
+        
+        # Calculate uptime in seconds - use system boot time for accurate session tracking
+        if system_boot:
+            session_uptime_seconds = int((now - system_boot).total_seconds())
+            session_start_iso = system_boot.isoformat()
+        else:
+            # Fallback if we can't read system boot time
+            session_uptime_seconds = 0
+            session_start_iso = None
+        
+        total_uptime_seconds = int((now - self._first_start_time).total_seconds())
+        
+        # Get current display mode from settings
+        display_mode = self._get_current_display_mode()
+        
+        # Update system resources
+        self._update_system_resources()
+        
+        with self._lock:
+            active_vehicles = self._active_vehicles
+            last_vehicle_data_ts = self._last_vehicle_data_ts
+            last_vehicle_id = self._last_vehicle_id
+            last_vehicle_status = self._last_vehicle_status
+            avg_api_latency = self._api_latency.avg
+            avg_update_time = self._update_times.avg
+            error_counts = list(self._error_counts)
+        
+        health_status = {
+            'timestamp': now.isoformat(),
+            'healthy': api_healthy and led_healthy,
+            'api_healthy': api_healthy,
+            'led_healthy': led_healthy,
+            'is_quiet_hours': is_quiet_hours,
+            'active_vehicles': active_vehicles,
+            'last_vehicle_update': (
+                {
+                    'timestamp': self._mono_to_datetime(last_vehicle_data_ts).isoformat(),
+                    'vehicle_id': last_vehicle_id,
+                    'status': last_vehicle_status
+                }
+                if last_vehicle_data_ts else None
+            ),
+            'display_mode': display_mode,
+            'avg_api_latency_ms': round(avg_api_latency, 2),
+            'avg_update_time_ms': round(avg_update_time, 2),
+            'error_counts': dict(zip(ERROR_TYPES, error_counts)),
+            'last_api_success': (
+                self._mono_to_datetime(last_api_success_ts).isoformat()
+                if last_api_success_ts else None
+            ),
+            'last_led_update': (
+                self._mono_to_datetime(last_led_update_ts).isoformat()
+                if last_led_update_ts else None
+            ),
+            'session_uptime_seconds': session_uptime_seconds,
+            'total_uptime_seconds': total_uptime_seconds,
+            'session_start_time': session_start_iso,
+            'first_start_time': self._first_start_time.isoformat(),
+            'memory_usage': self._memory_usage,
+            'cpu_temperature': self._cpu_temperature
+        }
+        
+        return health_status
+
     def get_performance_metrics(self) -> Dict:
         """Get detailed performance metrics."""
         with self._lock:
@@ -408,59 +702,244 @@ class SystemMetrics:
             
             # Only include metrics if we have data
             if self._api_latency:
-                metrics['api_latency'] = {
-                    'avg': round(sum(self._api_latency) / len(self._api_latency), 2),
-                    'min': round(min(self._api_latency), 2),
-                    'max': round(max(self._api_latency), 2),
-                    'samples': len(self._api_latency)
-                }
+                metrics['api_latency'] = self._api_latency.summary()
             
             if self._update_times:
-                metrics['update_times'] = {
-                    'avg': round(sum(self._update_times) / len(self._update_times), 2),
-                    'min': round(min(self._update_times), 2),
-                    'max': round(max(self._update_times), 2),
-                    'samples': len(self._update_times)
-                }
+                metrics['update_times'] = self._update_times.summary()
             
             if self._validation_times:
-                metrics['validation_times'] = {
-                    'avg': round(sum(self._validation_times) / len(self._validation_times), 2),
-                    'min': round(min(self._validation_times), 2),
-                    'max': round(max(self._validation_times), 2),
-                    'samples': len(self._validation_times)
-                }
+                metrics['validation_times'] = self._validation_times.summary()
             
             return metrics
     
-    def _load_shared_health(self) -> Optional[Dict]:
-        """Load health status from shared metrics file.
+    def _start_shared_json_watch(self) -> None:
+        """Watch the metrics directory for the writer's renames, if inotify is available."""
+        if INotify is None:
+            return
+        try:
+            inotify = INotify()
+            inotify.add_watch(os.path.dirname(self.metrics_file) or '.',
+                              inotify_flags.MOVED_TO | inotify_flags.CLOSE_WRITE)
+        except OSError as e:
+            logger.debug(f"inotify unavailable, falling back to mtime checks: {e}")
+            return
+        self._shared_json_watched = True
+        threading.Thread(target=self._watch_shared_json, args=(inotify,), daemon=True).start()
+    
+    def _watch_shared_json(self, inotify) -> None:
+        """Flag the shared JSON cache stale whenever the writer replaces the file.
+        
+        Args:
+            inotify: INotify instance watching the metrics directory
+        """
+        name = os.path.basename(self.metrics_file)
+        try:
+            while not self._stop_event.is_set():
+                # Timeout lets cleanup() stop the thread
+                for event in inotify.read(timeout=1000):
+                    if event.name == name:
+                        self._shared_json_changed = True
+        except OSError as e:
+            logger.warning(f"inotify watch failed, falling back to mtime checks: {e}")
+        finally:
+            self._shared_json_watched = False
+            inotify.close()
+    
+    def _load_shared_json(self) -> Optional[Dict]:
+        """Load health status from the shared JSON metrics file.
         
         Returns:
             Dict containing health status if file exists and is recent, None otherwise
         """
+        cached = self._shared_health_cache
+        if cached is not None and self._shared_json_watched and not self._shared_json_changed:
+            # No rename since the last load; only the age needs rechecking
+            if time.time() - cached[0] / 1e9 > METRICS_FILE_MAX_AGE_SECONDS:
+                return None
+            return cached[1]
+        # Clear before reading so a replace during the read is picked up next time
+        self._shared_json_changed = False
+        
+        try:
+            st = os.stat(self.metrics_file)
+        except FileNotFoundError:
+            logger.info(f"Shared metrics file does not exist: {self.metrics_file}")
+            return None
+        
+        # Check if file is recent (within last 2 minutes for inter-process communication)
+        file_age = time.time() - st.st_mtime
+        if file_age > METRICS_FILE_MAX_AGE_SECONDS:
+            logger.info(f"Shared metrics file too old: {file_age:.1f}s")
+            return None
+        
+        # Writer replaces the file atomically, so an unchanged mtime means unchanged content
+        if cached is not None and cached[0] == st.st_mtime_ns:
+            return cached[1]
+        
+        with open(self.metrics_file, 'rb') as f:
+            data = orjson.loads(f.read())
+        health_data = data.get('health')
+        self._shared_health_cache = (st.st_mtime_ns, health_data)
+        logger.info(f"Loaded shared health data: file_age={file_age:.1f}s, healthy={health_data.get('healthy', 'unknown')}")
+        return health_data
+    
+    @staticmethod
+    def _snapshot_path(metrics_file: str) -> str:
+        """Place the health snapshot in shared memory (tmpfs) when available.
+        
+        Args:
+            metrics_file: Path of the JSON metrics file
+            
+        Returns:
+            str: Snapshot path, next to the JSON file if there is no tmpfs
+        """
+        base = os.path.splitext(os.path.abspath(metrics_file))[0]
+        if os.path.isdir(METRICS_SHM_DIR):
+            # Named after the full path so separate checkouts don't share a segment
+            name = base.strip(os.sep).replace(os.sep, '_')
+            return os.path.join(METRICS_SHM_DIR, 'mbta_' + name + '.bin')
+        return base + '.bin'
+    
+    def _map_snapshot(self, writable: bool) -> Optional[mmap.mmap]:
+        """Map the health snapshot file, creating and sizing it for the writer.
+        
+        Args:
+            writable: True for the writer, False for read-only readers
+            
+        Returns:
+            mmap.mmap or None if the file does not exist yet or is too small
+        """
+        if self._snapshot_map is not None:
+            # The file may have been unlinked and recreated (tmpfs cleanup, writer
+            # restart); keep using the mapping only while it is still the same file
+            try:
+                ino = os.stat(self._snapshot_file).st_ino
+            except FileNotFoundError:
+                ino = None
+            if ino == self._snapshot_ino:
+                return self._snapshot_map
+            self._close_snapshot()
+        if writable:
+            fd = os.open(self._snapshot_file, os.O_RDWR | os.O_CREAT, 0o644)
+        else:
+            fd = os.open(self._snapshot_file, os.O_RDONLY)
         try:
-            if not os.path.exists(self.metrics_file):
-                logger.info(f"Shared metrics file does not exist: {self.metrics_file}")
+            if writable:
+                os.ftruncate(fd, _SNAPSHOT_SIZE)
+            st = os.fstat(fd)
+            if not writable and st.st_size < _SNAPSHOT_SIZE:
                 return None
+            self._snapshot_map = mmap.mmap(
+                fd, _SNAPSHOT_SIZE,
+                access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+            )
+            self._snapshot_ino = st.st_ino
+        finally:
+            os.close(fd)  # The mapping stays valid after the fd is closed
+        return self._snapshot_map
+    
+    def _read_health_snapshot(self) -> Optional[tuple]:
+        """Read the writer's binary health snapshot from the shared mapping.
+        
+        Returns:
+            tuple of _HEALTH_SNAPSHOT fields, or None if unavailable
+        """
+        try:
+            snapshot = self._map_snapshot(writable=False)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not map health snapshot: {e}")
+            return None
+        if snapshot is None:
+            return None
+        return _read_snapshot_fields(snapshot)
+    
+    def _write_health_snapshot(self, health: Dict) -> None:
+        """Overwrite the shared health snapshot in place with the current values.
+        
+        Args:
+            health: Health status dict from get_health_status()
+        """
+        now = time.time()
+        offset = now - time.monotonic()  # Current offset, so clock steps after boot are picked up
+        api_ts = self._last_api_success_ts[0]
+        led_ts = self._last_led_update_ts[0]
+        memory = health.get('memory_usage') or {}
+        cpu_temperature = health.get('cpu_temperature')
+        snapshot = self._map_snapshot(writable=True)
+        
+        self._snapshot_seq += 1
+        _SNAPSHOT_SEQ.pack_into(snapshot, 0, self._snapshot_seq)
+        _HEALTH_SNAPSHOT.pack_into(
+            snapshot, _SNAPSHOT_SEQ.size,
+            now,
+            api_ts + offset if api_ts else 0.0,
+            led_ts + offset if led_ts else 0.0,
+            health['api_healthy'],
+            health['led_healthy'],
+            health['is_quiet_hours'],
+            self._active_vehicles,
+            self._api_latency.avg,
+            self._update_times.avg,
+            # Start times rather than uptimes, so readers can count uptime between writes
+            now - health['session_uptime_seconds'] if health['session_start_time'] else 0.0,
+            now - health['total_uptime_seconds'],
+            memory.get('total_mb', 0),
+            memory.get('used_mb', 0),
+            memory.get('free_mb', 0),
+            memory.get('percent_used', 0.0),
+            math.nan if cpu_temperature is None else cpu_temperature,
+            *self._error_counts
+        )
+        self._snapshot_seq += 1
+        _SNAPSHOT_SEQ.pack_into(snapshot, 0, self._snapshot_seq)
+    
+    def _close_snapshot(self) -> None:
+        """Unmap the shared health snapshot if mapped."""
+        if self._snapshot_map is not None:
+            try:
+                self._snapshot_map.close()
+            except (OSError, ValueError):
+                pass
+            self._snapshot_map = None
+            self._snapshot_ino = None
+    
+    def _load_shared_health(self) -> Optional[Dict]:
+        """Load health status shared by the writer process.
+        
+        Everything the status display needs comes from the binary snapshot,
+        which the writer refreshes every save cycle, with uptimes counted up to
+        now and the display mode read from .env here. The JSON metrics file,
+        rewritten less often, only supplies the remaining detail fields
+        (e.g. last_vehicle_update).
+        
+        Returns:
+            Dict containing health status if the writer is running, None otherwise
+        """
+        try:
+            snapshot = self._read_health_snapshot()
+            if snapshot is None:
+                # No snapshot (e.g. older writer) - use the JSON file alone
+                return self._load_shared_json()
             
-            # Check if file is recent (within last 2 minutes for inter-process communication)
-            file_age = time.time() - os.path.getmtime(self.metrics_file)
-            if file_age > METRICS_FILE_MAX_AGE_SECONDS:
-                logger.info(f"Shared metrics file too old: {file_age:.1f}s")
+            written_at = snapshot[0]
+            if time.time() - written_at > METRICS_FILE_MAX_AGE_SECONDS:
+                logger.info(f"Shared health snapshot too old: {time.time() - written_at:.1f}s")
                 return None
             
-            with open(self.metrics_file, 'r') as f:
-                # Acquire shared lock for reading
-                fcntl.flock(f.fileno(), fcntl.LOCK_SH)
-                try:
-                    data = json.load(f)
-                    health_data = data.get('health')
-                    logger.info(f"Loaded shared health data: file_age={file_age:.1f}s, healthy={health_data.get('healthy', 'unknown')}")
-                    return health_data
-                finally:
-                    # Release the lock
-                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            json_health = self._load_shared_json() or {}
+            cached = self._snapshot_health_cache
+            if cached is None or cached[0] != written_at or cached[1] is not json_health:
+                _, session_start, first_start, snapshot_health = _decode_health_snapshot(snapshot)
+                health_data = dict(json_health)
+                health_data.update(snapshot_health)
+                cached = (written_at, json_health, health_data, session_start, first_start)
+                self._snapshot_health_cache = cached
+            
+            health_data = _with_uptimes(cached[2], cached[3], cached[4])
+            health_data['display_mode'] = self._get_current_display_mode()
+            return health_data
         except Exception as e:
             logger.error(f"Could not load shared health data: {e}")
             return None
@@ -468,48 +947,65 @@ class SystemMetrics:
     def _periodic_save(self) -> None:
         """Periodically save metrics to file."""
         # Wait 30 seconds before first save to allow system to initialize
-        time.sleep(METRICS_INITIAL_SAVE_DELAY_SECONDS)
+        if self._stop_event.wait(METRICS_INITIAL_SAVE_DELAY_SECONDS):
+            return
+        
+        last_save = 0.0
+        last_json_save = 0.0
         
-        while self._should_run:
+        while not self._stop_event.is_set():
             try:
                 # Always save if we have any meaningful data
                 has_data = (
-                    self._last_api_success is not None or 
-                    self._last_led_update is not None or
+                    self._last_api_success_ts[0] or
+                    self._last_led_update_ts[0] or
                     self._active_vehicles > 0 or
-                    any(count > 0 for count in self._error_counts.values())
+                    any(self._error_counts)
                 )
                 
-                if has_data:
-                    metrics = {
-                        'health': self.get_health_status(),
-                        'performance': self.get_performance_metrics()
-                    }
+                # Skip the write when nothing was recorded, but still refresh the file
+                # before readers would consider it stale (uptime/health age over time)
+                due = time.monotonic() - last_save >= METRICS_MAX_CLEAN_SAVE_INTERVAL_SECONDS
+                
+                if has_data and (self._dirty or due):
+                    self._dirty = False
+                    health = self.get_health_status()
                     
-                    # Ensure directory exists
-                    os.makedirs(os.path.dirname(self.metrics_file), exist_ok=True)
+                    # Hot fields go out every cycle via the small binary snapshot
+                    self._write_health_snapshot(health)
+                    last_save = time.monotonic()
                     
-                    # Save metrics with file locking to prevent concurrent access conflicts
-                    with open(self.metrics_file, 'w') as f:
-                        # Acquire exclusive lock on the file
-                        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-                        try:
-                            json.dump(metrics, f)
-                            f.flush()  # Ensure data is written to disk
-                            os.fsync(f.fileno())  # Force sync to disk
-                        finally:
-                            # Release the lock
-                            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+                    # The full JSON (for humans, status_check and the remaining fields)
+                    # is only rewritten every METRICS_JSON_SAVE_INTERVAL_SECONDS
+                    if last_save - last_json_save >= METRICS_JSON_SAVE_INTERVAL_SECONDS:
+                        metrics = {
+                            'health': health,
+                            'performance': self.get_performance_metrics()
+                        }
+                        
+                        # Write to a temp file and rename over the target so readers
+                        # always see either the previous or the new complete file.
+                        # No fsync: losing the last cycle on a crash is harmless and
+                        # the page cache spares the SD card a barrier per save.
+                        tmp_file = self.metrics_file + '.tmp'
+                        with open(tmp_file, 'wb') as f:
+                            f.write(orjson.dumps(metrics))
+                        os.replace(tmp_file, self.metrics_file)
+                        last_json_save = last_save
                     
-                    logger.debug(f"Saved metrics to {self.metrics_file} - last_api_success: {metrics['health'].get('last_api_success')}")
+                    logger.debug(f"Saved metrics to {self.metrics_file} - last_api_success: {health.get('last_api_success')}")
                 
             except Exception as e:
+                self._dirty = True  # Retry on the next cycle
                 logger.error(f"Failed to save metrics: {e}")
             
-            time.sleep(METRICS_SAVE_INTERVAL_SECONDS)  # Save every 15 seconds for better responsiveness with SSE data
+            # Save every 15 seconds for better responsiveness with SSE data; wakes early on cleanup()
+            if self._stop_event.wait(METRICS_SAVE_INTERVAL_SECONDS):
+                break
     
     def cleanup(self) -> None:
         """Clean up resources."""
-        self._should_run = False
+        self._stop_event.set()
         if self._save_thread and self._save_thread.is_alive():
-            self._save_thread.join(timeout=5) 
\ No newline at end of file
+            self._save_thread.join(timeout=5)
+        self._close_snapshot() 
\ No newline at end of file
@@ -10,63 +10,107 @@ reconnection when it fails, this monitor provides:
 2. LED feedback: Updates the LED display to show network status (red=disconnected)
 3. WiFi recovery: Attempts to restart the wireless interface on connection loss
 
-Design note: This runs as a separate thread polling every 30 seconds. On a Pi Zero 2W,
-this overhead is minimal (brief network request). The proactive monitoring
-improves user experience by providing immediate visual feedback when network issues
-occur, rather than waiting for the SSE stream to timeout.
+Design note: A single ConnectivityService per process runs one poll thread and pushes
+disconnect/reconnect callbacks to every subscribed NetworkMonitor. It probes every 30
+seconds, doubling the interval while the connection stays up to a ceiling of 60 seconds
+(so an outage is noticed within a minute), and drops back to 30 seconds on any failure.
+On a Pi Zero 2W each probe is minimal (a single TCP connect to the MBTA API host). The
+proactive monitoring improves user experience by providing prompt visual feedback when
+network issues occur, rather than waiting for the SSE stream to timeout.
 
 If you want to disable this for lower resource usage, you can remove the NetworkMonitor
 initialization from mbta_stream.py and handle network status purely based on SSE failures.
 """
 
 import subprocess
+import socket
 import time
 import logging
 import threading
-import requests
-from typing import Optional, Callable
+from typing import Optional, Callable, List
 from datetime import datetime, timedelta
 from config.constants import (
     NETWORK_MAX_RETRIES,
     NETWORK_CHECK_INTERVAL_SECONDS,
+    NETWORK_MAX_CHECK_INTERVAL_SECONDS,
     NETWORK_REQUEST_TIMEOUT_SECONDS,
+    NETWORK_CHECK_HOST,
+    NETWORK_CHECK_PORT,
+    NETWORK_DNS_CACHE_SECONDS,
     WIFI_INTERFACE_DOWN_WAIT_SECONDS,
     WIFI_INTERFACE_UP_WAIT_SECONDS,
     WIFI_RECONNECTION_WAIT_SECONDS,
+    WIFI_INTERFACE_NAME,
 )
 
+try:
+    # Optional: talk to the kernel over netlink instead of fork/exec'ing ifconfig
+    from pyroute2 import IPRoute
+except ImportError:
+    IPRoute = None
+
 logger = logging.getLogger(__name__)
 
-class NetworkMonitor:
-    """Monitors network connectivity and handles reconnection attempts."""
+class ConnectivityService:
+    """Polls network connectivity once and broadcasts changes to all subscribers.
     
-    def __init__(self, 
-                 on_disconnect: Optional[Callable] = None,
-                 on_reconnect: Optional[Callable] = None,
-                 max_retries: int = NETWORK_MAX_RETRIES,
+    A single instance is shared by every NetworkMonitor in the process (see
+    get_connectivity_service), so N monitors cost one probe per interval.
+    """
+    
+    def __init__(self, max_retries: int = NETWORK_MAX_RETRIES,
                  check_interval: int = NETWORK_CHECK_INTERVAL_SECONDS):
-        """Initialize the network monitor.
+        """Initialize the connectivity service.
         
         Args:
-            on_disconnect: Callback function when network disconnects
-            on_reconnect: Callback function when network reconnects
             max_retries: Maximum number of reconnection attempts
             check_interval: Seconds between connectivity checks
         """
-        self.on_disconnect = on_disconnect
-        self.on_reconnect = on_reconnect
         self.max_retries = max_retries
         self.check_interval = check_interval
         
         self._is_connected = True
         self._last_connected = datetime.now()
         self._retry_count = 0
-        self._should_run = True
+        self._stable_checks = 0  # Consecutive successful checks, drives interval backoff
+        self._stop_event = threading.Event()
         self._lock = threading.Lock()
         
-        # Start monitoring thread
-        self._monitor_thread = threading.Thread(target=self._monitor_connection, daemon=True)
-        self._monitor_thread.start()
+        # Resolved address of NETWORK_CHECK_HOST, refreshed periodically to skip DNS
+        self._host_ip: Optional[str] = None
+        self._host_ip_resolved_at = 0.0
+        
+        # Subscribed NetworkMonitors; the poll thread runs while there is at least one
+        self._subscribers: List['NetworkMonitor'] = []
+        self._monitor_thread: Optional[threading.Thread] = None
+    
+    def subscribe(self, monitor: 'NetworkMonitor') -> None:
+        """Register a monitor for connectivity callbacks, starting polling if needed."""
+        with self._lock:
+            self._subscribers.append(monitor)
+            if self._monitor_thread is None or not self._monitor_thread.is_alive():
+                self._stop_event.clear()
+                self._monitor_thread = threading.Thread(target=self._monitor_connection, daemon=True)
+                self._monitor_thread.start()
+    
+    def unsubscribe(self, monitor: 'NetworkMonitor') -> None:
+        """Remove a monitor, stopping polling once no subscribers remain."""
+        with self._lock:
+            if monitor in self._subscribers:
+                self._subscribers.remove(monitor)
+            if self._subscribers:
+                return
+            self._stop_event.set()
+            thread = self._monitor_thread
+        if thread and thread.is_alive():
+            thread.join(timeout=5)
+    
+    def _notify(self, callback_name: str) -> None:
+        """Invoke the named callback on every subscriber that set one."""
+        for monitor in list(self._subscribers):
+            callback = getattr(monitor, callback_name)
+            if callback:
+                callback()
     
     def _check_connection(self) -> bool:
         """Check if network is connected.
@@ -75,10 +119,19 @@ class NetworkMonitor:
             bool: True if connected
         """
         try:
-            # Try to reach a reliable endpoint
-            response = requests.get("https://api-v3.mbta.com/", timeout=NETWORK_REQUEST_TIMEOUT_SECONDS)
-            return response.status_code == 200
+            now = time.monotonic()
+            if self._host_ip is None or now - self._host_ip_resolved_at > NETWORK_DNS_CACHE_SECONDS:
+                self._host_ip = socket.gethostbyname(NETWORK_CHECK_HOST)
+                self._host_ip_resolved_at = now
+            
+            # A TCP connect to the API host is enough to answer "are we online?"
+            # without paying for a TLS handshake and HTTP response
+            with socket.create_connection((self._host_ip, NETWORK_CHECK_PORT),
+                                          timeout=NETWORK_REQUEST_TIMEOUT_SECONDS):
+                return True
         except Exception:
+            # Re-resolve next time in case the cached address went bad
+            self._host_ip = None
             return False
     
     def _attempt_reconnect(self) -> bool:
@@ -89,9 +142,10 @@ class NetworkMonitor:
         """
         try:
             # Restart the wireless interface
-            subprocess.run(['sudo', 'ifconfig', 'wlan0', 'down'], timeout=NETWORK_REQUEST_TIMEOUT_SECONDS)
-            time.sleep(WIFI_INTERFACE_DOWN_WAIT_SECONDS)
-            subprocess.run(['sudo', 'ifconfig', 'wlan0', 'up'], timeout=NETWORK_REQUEST_TIMEOUT_SECONDS)
+            if not self._restart_interface_netlink():
+                subprocess.run(['sudo', 'ifconfig', WIFI_INTERFACE_NAME, 'down'], timeout=NETWORK_REQUEST_TIMEOUT_SECONDS)
+                time.sleep(WIFI_INTERFACE_DOWN_WAIT_SECONDS)
+                subprocess.run(['sudo', 'ifconfig', WIFI_INTERFACE_NAME, 'up'], timeout=NETWORK_REQUEST_TIMEOUT_SECONDS)
             time.sleep(WIFI_INTERFACE_UP_WAIT_SECONDS)  # Wait for interface to initialize
             
             # Check if reconnection worked
@@ -99,9 +153,28 @@ class NetworkMonitor:
         except Exception:
             return False
     
+    def _restart_interface_netlink(self) -> bool:
+        """Bounce the wireless interface via netlink (requires pyroute2 and CAP_NET_ADMIN).
+        
+        Returns:
+            bool: True if the interface was restarted, False to fall back to ifconfig
+        """
+        if IPRoute is None:
+            return False
+        try:
+            with IPRoute() as ip:
+                idx = ip.link_lookup(ifname=WIFI_INTERFACE_NAME)[0]
+                ip.link('set', index=idx, state='down')
+                time.sleep(WIFI_INTERFACE_DOWN_WAIT_SECONDS)
+                ip.link('set', index=idx, state='up')
+            return True
+        except Exception as e:
+            logger.debug(f"Netlink interface restart failed, falling back to ifconfig: {e}")
+            return False
+    
     def _monitor_connection(self) -> None:
         """Monitor network connection and handle reconnection."""
-        while self._should_run:
+        while not self._stop_event.is_set():
             is_connected = self._check_connection()
             
             with self._lock:
@@ -111,31 +184,41 @@ class NetworkMonitor:
                     self._is_connected = True
                     self._last_connected = datetime.now()
                     self._retry_count = 0
-                    if self.on_reconnect:
-                        self.on_reconnect()
+                    self._notify('on_reconnect')
                 
                 elif not is_connected and self._is_connected:
                     # Network lost
                     logger.warning("Network connection lost")
                     self._is_connected = False
-                    if self.on_disconnect:
-                        self.on_disconnect()
+                    self._notify('on_disconnect')
                     
                     # Attempt reconnection
                     while (not self._is_connected and 
                            self._retry_count < self.max_retries and 
-                           self._should_run):
+                           not self._stop_event.is_set()):
                         logger.info(f"Attempting reconnection (attempt {self._retry_count + 1}/{self.max_retries})")
                         if self._attempt_reconnect():
                             self._is_connected = True
                             self._last_connected = datetime.now()
-                            if self.on_reconnect:
-                                self.on_reconnect()
+                            self._notify('on_reconnect')
                             break
                         self._retry_count += 1
-                        time.sleep(WIFI_RECONNECTION_WAIT_SECONDS)  # Wait between attempts
+                        self._stop_event.wait(WIFI_RECONNECTION_WAIT_SECONDS)  # Wait between attempts
             
-            time.sleep(self.check_interval)
+            # Back off exponentially while the connection is stable; any failure
+            # drops straight back to the base interval
+            if is_connected:
+                interval = min(self.check_interval * (2 ** self._stable_checks),
+                               NETWORK_MAX_CHECK_INTERVAL_SECONDS)
+                if interval < NETWORK_MAX_CHECK_INTERVAL_SECONDS:
+                    self._stable_checks += 1
+            else:
+                self._stable_checks = 0
+                interval = self.check_interval
+            
+            # Wakes early when the last subscriber unsubscribes
+            if self._stop_event.wait(interval):
+                break
     
     def is_connected(self) -> bool:
         """Check if network is currently connected.
@@ -159,8 +242,71 @@ class NetworkMonitor:
                 'retry_count': self._retry_count
             }
     
+
+
+_connectivity_singleton: Optional[ConnectivityService] = None
+_connectivity_singleton_lock = threading.Lock()
+
+
+def get_connectivity_service(max_retries: int = NETWORK_MAX_RETRIES,
+                             check_interval: int = NETWORK_CHECK_INTERVAL_SECONDS) -> ConnectivityService:
+    """Get the process-wide ConnectivityService, creating it on first use.
+    
+    Args:
+        max_retries: Maximum number of reconnection attempts (first caller wins)
+        check_interval: Seconds between connectivity checks (first caller wins)
+        
+    Returns:
+        ConnectivityService: The shared service instance
+    """
+    global _connectivity_singleton
+    with _connectivity_singleton_lock:
+        if _connectivity_singleton is None:
+            _connectivity_singleton = ConnectivityService(max_retries, check_interval)
+        return _connectivity_singleton
+
+
+class NetworkMonitor:
+    """Monitors network connectivity and handles reconnection attempts.
+    
+    Thin subscriber to the shared ConnectivityService; all monitors in a
+    process share one poll thread.
+    """
+    
+    def __init__(self, 
+                 on_disconnect: Optional[Callable] = None,
+                 on_reconnect: Optional[Callable] = None,
+                 max_retries: int = NETWORK_MAX_RETRIES,
+                 check_interval: int = NETWORK_CHECK_INTERVAL_SECONDS):
+        """Initialize the network monitor.
+        
+        Args:
+            on_disconnect: Callback function when network disconnects
+            on_reconnect: Callback function when network reconnects
+            max_retries: Maximum number of reconnection attempts
+            check_interval: Seconds between connectivity checks
+        """
+        self.on_disconnect = on_disconnect
+        self.on_reconnect = on_reconnect
+        self._service = get_connectivity_service(max_retries, check_interval)
+        self._service.subscribe(self)
+    
+    def is_connected(self) -> bool:
+        """Check if network is currently connected.
+        
+        Returns:
+            bool: True if connected
+        """
+        return self._service.is_connected()
+    
+    def get_status(self) -> dict:
+        """Get current network status.
+        
+        Returns:
+            dict: Network status information
+        """
+        return self._service.get_status()
+    
     def cleanup(self) -> None:
         """Clean up resources."""
-        self._should_run = False
-        if self._monitor_thread.is_alive():
-            self._monitor_thread.join(timeout=5)
+        self._service.unsubscribe(self)
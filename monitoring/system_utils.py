@@ -1,12 +1,53 @@
 """Shared system utilities for monitoring and formatting."""
-import subprocess
+import atexit
+import functools
 import logging
-from typing import Dict, Optional
-from datetime import timedelta
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+from config.constants import METRICS_CACHE_TTL_SECONDS
 
 logger = logging.getLogger(__name__)
 
+_THERMAL_PATH = '/sys/class/thermal/thermal_zone0/temp'
+# Kept open between calls; sysfs regenerates the value on each read from offset 0
+_thermal_fd = None
+# Serializes open/seek/read on the shared handle across collect_all() and direct callers.
+# Reentrant because a failed read closes the handle while holding it.
+_thermal_lock = threading.RLock()
+
+# Runs the memory and temperature reads side by side in collect_all()
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='system-metrics')
+
+
+def ttl_cache(seconds: float) -> Callable:
+    """Cache a no-argument function's result for a short time.
+    
+    Args:
+        seconds: How long a result is reused before calling the function again
+        
+    Returns:
+        Decorator that wraps the function with the cache
+    """
+    def decorator(func: Callable) -> Callable:
+        cached = (float('-inf'), None)  # (monotonic time stored, value)
+        
+        @functools.wraps(func)
+        def wrapper():
+            nonlocal cached
+            now = time.monotonic()
+            if now - cached[0] < seconds:
+                return cached[1]
+            value = func()
+            cached = (now, value)
+            return value
+        return wrapper
+    return decorator
+
 
+@ttl_cache(METRICS_CACHE_TTL_SECONDS)
 def get_memory_usage() -> Optional[Dict]:
     """Get memory usage statistics.
     
@@ -14,14 +55,19 @@ def get_memory_usage() -> Optional[Dict]:
         Dictionary with memory stats or None if unavailable
     """
     try:
-        result = subprocess.run(['free', '-m'], capture_output=True, text=True)
-        lines = result.stdout.strip().split('\n')
-        memory = lines[1].split()
+        # Read the kernel counters directly rather than fork/exec'ing `free -m`
+        meminfo = {}
+        with open('/proc/meminfo', 'r') as f:
+            for line in f:
+                key, value = line.split(':', 1)
+                if key in ('MemTotal', 'MemFree', 'MemAvailable'):
+                    meminfo[key] = int(value.split()[0])  # kB
         
-        # Calculate percentage used
-        total = int(memory[1])
-        used = int(memory[2])
-        free = int(memory[3])
+        # Used = total minus what is available to applications (as modern `free` reports it)
+        total = meminfo['MemTotal'] // 1024
+        free = meminfo['MemFree'] // 1024
+        available = meminfo.get('MemAvailable', meminfo['MemFree']) // 1024
+        used = total - available
         percent_used = round((used / total) * 100, 1) if total > 0 else 0
         
         return {
@@ -35,24 +81,64 @@ def get_memory_usage() -> Optional[Dict]:
         return None
 
 
+@ttl_cache(METRICS_CACHE_TTL_SECONDS)
 def get_cpu_temperature() -> Optional[float]:
     """Get CPU temperature (Raspberry Pi specific).
     
     Returns:
         Temperature in Celsius or None if unavailable
     """
-    try:
-        with open('/sys/class/thermal/thermal_zone0/temp', 'r') as f:
-            temp = float(f.read()) / 1000.0
+    global _thermal_fd
+    with _thermal_lock:
+        try:
+            if _thermal_fd is None:
+                _thermal_fd = open(_THERMAL_PATH, 'r')
+            _thermal_fd.seek(0)
+            temp = float(_thermal_fd.read()) / 1000.0
             return round(temp, 1)
-    except Exception as e:
-        logger.debug(f"Failed to get CPU temperature: {e}")
-        return None
+        except Exception as e:
+            # Drop the handle so the next call reopens it (e.g. after EIO)
+            close_thermal_fd()
+            logger.debug(f"Failed to get CPU temperature: {e}")
+            return None
+
+
+def close_thermal_fd() -> None:
+    """Close the cached thermal zone file handle, if open."""
+    global _thermal_fd
+    with _thermal_lock:
+        if _thermal_fd is not None:
+            try:
+                _thermal_fd.close()
+            except OSError:
+                pass
+            _thermal_fd = None
+
+
+atexit.register(close_thermal_fd)
 
 
+def collect_all() -> Dict:
+    """Read memory usage and CPU temperature concurrently.
+    
+    Returns:
+        Dictionary with 'memory_usage' and 'cpu_temperature' (either may be None)
+    """
+    memory = _executor.submit(get_memory_usage)
+    temperature = _executor.submit(get_cpu_temperature)
+    return {
+        'memory_usage': memory.result(),
+        'cpu_temperature': temperature.result()
+    }
+
+
+@functools.lru_cache(maxsize=256)
 def format_uptime(seconds: int) -> str:
     """Format uptime in human-readable format.
     
+    Cached because the web status is rebuilt far more often than the
+    whole-second uptime values change.
+    
     Args:
         seconds: Uptime in seconds
         
@@ -62,9 +148,8 @@ def format_uptime(seconds: int) -> str:
     if seconds <= 0:
         return "Unknown"
     
-    uptime = timedelta(seconds=seconds)
-    days = uptime.days
-    hours, remainder = divmod(uptime.seconds, 3600)
+    days, remainder = divmod(int(seconds), 86400)
+    hours, remainder = divmod(remainder, 3600)
     minutes, secs = divmod(remainder, 60)
     
     if days > 0:
@@ -2,13 +2,24 @@
 import subprocess
 import sys
 import os
+import re
+import selectors
 import signal
 import time
 import logging
 import traceback
+import queue
+import atexit
 import json
+from importlib.util import find_spec
 from datetime import datetime, timedelta
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+
+try:
+    # C JSON parser when available (installed via setup.py)
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 # Add project root to path for imports
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -31,28 +42,58 @@ from config.constants import (
     LED_CONTROLLER_STARTUP_DELAY_SECONDS,
     PROCESS_TERMINATE_TIMEOUT_SECONDS,
     MONITOR_LOOP_INTERVAL_SECONDS,
+    WEB_SERVER_PORT,
+    WEB_SERVER_WORKERS,
+    WEB_SERVER_THREADS,
+    WEB_SERVER_KEEPALIVE_SECONDS,
 )
 
 # Configure logging
 # Note: No StreamHandler - when running via systemd, stdout is captured by journalctl
-os.makedirs('logs', exist_ok=True)
+# Records are queued and written by a background listener so that disk I/O never
+# delays the process monitor loop.
+# The log file below is opened at import, so logs/ must exist here; a bare mkdir
+# is a single syscall when it already does
+try:
+    os.mkdir('logs')
+except FileExistsError:
+    pass
+_file_handler = RotatingFileHandler(
+    'logs/startup.log',
+    maxBytes=LOG_FILE_MAX_BYTES,
+    backupCount=LOG_FILE_BACKUP_COUNT,
+    encoding='utf-8'
+)
+_file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+_log_queue = queue.Queue(-1)
+_log_listener = QueueListener(_log_queue, _file_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        RotatingFileHandler(
-            'logs/startup.log',
-            maxBytes=LOG_FILE_MAX_BYTES,
-            backupCount=LOG_FILE_BACKUP_COUNT,
-            encoding='utf-8'
-        )
-    ]
+    format='%(message)s',  # The listener's file handler applies the real format
+    handlers=[QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
 # Reboot loop protection file path
 REBOOT_COUNTER_FILE = 'logs/reboot_counter.json'
 
+# Child stdout/stderr pipes, registered once in start_process; data is (name, stream name)
+_output_selector = selectors.DefaultSelector()
+# Bytes read from each pipe (keyed by fd) that don't yet end in a newline
+_output_buffers = {}
+OUTPUT_READ_SIZE = 4096
+
+# Keyword filters for process output, compiled once (case-insensitive, so no .lower() per line)
+_STDOUT_IMPORTANT_RE = re.compile(r'error|warning|critical|failed|exception', re.IGNORECASE)
+_ERROR_RE = re.compile(r'error|warning|critical|failed|exception|traceback', re.IGNORECASE)
+_INFO_RE = re.compile(
+    r'settings (?:loaded|saved) successfully|settings file modified|forcing settings reload|updated bedtime',
+    re.IGNORECASE
+)
+_FLASK_RE = re.compile(r'serving flask app|development server|production deployment|werkzeug|flask', re.IGNORECASE)
+
 
 def get_reboot_count() -> int:
     """Get the current reboot count from the counter file.
@@ -61,11 +102,8 @@ def get_reboot_count() -> int:
         int: Number of reboots within the time window, or 0 if counter is stale/missing
     """
     try:
-        if not os.path.exists(REBOOT_COUNTER_FILE):
-            return 0
-        
         with open(REBOOT_COUNTER_FILE, 'r') as f:
-            data = json.load(f)
+            data = json_loads(f.read())
         
         # Check if the counter is within the time window
         last_reboot_time = datetime.fromisoformat(data.get('last_reboot_time', ''))
@@ -76,6 +114,8 @@ def get_reboot_count() -> int:
             return 0
         
         return data.get('count', 0)
+    except FileNotFoundError:
+        return 0
     except Exception as e:
         logger.warning(f"Failed to read reboot counter: {e}")
         return 0
@@ -88,16 +128,34 @@ def increment_reboot_count() -> int:
         int: The new reboot count after incrementing
     """
     try:
-        current_count = get_reboot_count()
-        new_count = current_count + 1
+        # Read the counter once, then replace it atomically so an interrupted
+        # write can never leave a corrupt file (which would trip safe mode)
+        current_count = 0
+        try:
+            with open(REBOOT_COUNTER_FILE, 'r') as f:
+                data = json_loads(f.read())
+            # Only count reboots within the time window
+            last_reboot_time = datetime.fromisoformat(data.get('last_reboot_time', ''))
+            if datetime.now() - last_reboot_time > timedelta(hours=REBOOT_WINDOW_HOURS):
+                logger.info(f"Reboot counter expired (last reboot was {last_reboot_time}), resetting to 0")
+            else:
+                current_count = int(data.get('count', 0))
+        except FileNotFoundError:
+            pass  # Common case: reset after the last clean startup, so this is reboot 1
+        except Exception as e:
+            # Unreadable, corrupt or wrongly shaped counter file - start over rather than trip safe mode
+            logger.warning(f"Failed to read reboot counter: {e}")
         
+        new_count = current_count + 1
         data = {
             'count': new_count,
             'last_reboot_time': datetime.now().isoformat()
         }
         
-        with open(REBOOT_COUNTER_FILE, 'w') as f:
-            json.dump(data, f, indent=2)
+        tmp_file = REBOOT_COUNTER_FILE + '.tmp'
+        with open(tmp_file, 'w') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(tmp_file, REBOOT_COUNTER_FILE)
         
         logger.info(f"Reboot counter incremented to {new_count}/{MAX_REBOOTS}")
         return new_count
@@ -116,45 +174,59 @@ def reset_reboot_count() -> None:
         logger.warning(f"Failed to reset reboot counter: {e}")
 
 
+# NeoPixel strip used by safe mode, created on the first set_leds_blue_fallback() call
+_safe_pixels = None
+
+
+def _get_safe_mode_led_count() -> int:
+    """Determine the LED count from the Red line map, falling back to the default."""
+    try:
+        from config.station_led_maps import station_led_maps
+        # Get LED count from Red line as default
+        outbound_map, inbound_map = station_led_maps.get('Red', (lambda: ({}, {})))()
+        if outbound_map or inbound_map:
+            return max(
+                max(outbound_map.values()) if outbound_map else 0,
+                max(inbound_map.values()) if inbound_map else 0
+            ) + LED_COUNT_ADJUSTMENT  # +1 for 0-indexing, +3 for color key
+    except Exception:
+        pass  # Use default LED count
+    return DEFAULT_LED_COUNT
+
+
 def set_leds_blue_fallback() -> None:
     """Set all LEDs to blue as a fallback when max reboots reached.
     
     This function attempts to directly control the LEDs without going through
     the full application stack, as a visual indicator that safe mode is active.
+    The strip is initialized once; later calls only refresh it.
     """
+    global _safe_pixels
     try:
-        import board
-        import neopixel
-        
-        # Try to determine LED count from config, fallback to reasonable default
-        led_count = DEFAULT_LED_COUNT  # Default fallback
-        try:
-            from config.station_led_maps import station_led_maps
-            # Get LED count from Red line as default
-            outbound_map, inbound_map = station_led_maps.get('Red', (lambda: ({}, {})))()
-            if outbound_map or inbound_map:
-                led_count = max(
-                    max(outbound_map.values()) if outbound_map else 0,
-                    max(inbound_map.values()) if inbound_map else 0
-                ) + LED_COUNT_ADJUSTMENT  # +1 for 0-indexing, +3 for color key
-        except Exception:
-            pass  # Use default LED count
-        
-        logger.info(f"Setting {led_count} LEDs to blue (safe mode indicator)")
-        
-        pixels = neopixel.NeoPixel(
-            board.D18,
-            led_count,
-            brightness=SAFE_MODE_BRIGHTNESS,  # Lower brightness for safe mode
-            auto_write=False,
-            pixel_order=neopixel.GRB
-        )
-        
-        # Set all LEDs to blue
-        pixels.fill(SAFE_MODE_COLOR)
-        pixels.show()
+        if _safe_pixels is None:
+            import board
+            import neopixel
+            
+            led_count = _get_safe_mode_led_count()
+            logger.info(f"Setting {led_count} LEDs to blue (safe mode indicator)")
+            
+            _safe_pixels = neopixel.NeoPixel(
+                board.D18,
+                led_count,
+                brightness=SAFE_MODE_BRIGHTNESS,  # Lower brightness for safe mode
+                auto_write=False,
+                pixel_order=neopixel.GRB
+            )
+            
+            # Set all LEDs to blue
+            _safe_pixels.fill(SAFE_MODE_COLOR)
+            _safe_pixels.show()
+            logger.info("LEDs set to blue successfully")
+            return
         
-        logger.info("LEDs set to blue successfully")
+        # Refill the buffer and re-send it in case the strip was reset
+        _safe_pixels.fill(SAFE_MODE_COLOR)
+        _safe_pixels.show()
     except Exception as e:
         logger.error(f"Failed to set LEDs to blue: {e}")
 
@@ -209,10 +281,10 @@ def log_detailed_error(name: str, process, error: Exception = None) -> None:
                 f.write("STDOUT:\n")
                 stdout, stderr = process.communicate()
                 if stdout:
-                    f.write(stdout)
+                    f.write(stdout.decode('utf-8', 'replace'))
                 f.write("\nSTDERR:\n")
                 if stderr:
-                    f.write(stderr)
+                    f.write(stderr.decode('utf-8', 'replace'))
         
         logger.error(f"Detailed error log written to {error_log_path}")
     except Exception as e:
@@ -267,13 +339,17 @@ def start_process(command, name):
             cwd=startup_project_dir,  # Run from project root directory
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            universal_newlines=True,
-            bufsize=1,  # Line buffered
+            bufsize=65536,  # Binary pipes; lines are split in monitor_output
             # Add these for better process management
             preexec_fn=os.setsid,  # Create new process group
             close_fds=True
         )
         
+        for stream_name, stream in (('stdout', process.stdout), ('stderr', process.stderr)):
+            os.set_blocking(stream.fileno(), False)
+            _output_buffers[stream.fileno()] = bytearray()
+            _output_selector.register(stream, selectors.EVENT_READ, (name, stream_name))
+        
         logger.info(f"Started {name} (PID: {process.pid})")
         return process
     except Exception as e:
@@ -281,42 +357,64 @@ def start_process(command, name):
         log_detailed_error(name, None, e)
         return None
 
-def monitor_output(process, name, quiet_mode=False):
-    """Monitor a process's output in a non-blocking way."""
-    try:
-        # Use non-blocking reads with timeout
-        import select
-        
-        # Check stdout
-        if process.stdout and select.select([process.stdout], [], [], 0.0)[0]:
-            line = process.stdout.readline()
-            if line:
-                # In quiet mode, only log important messages
-                if not quiet_mode or any(keyword in line.lower() for keyword in ['error', 'warning', 'critical', 'failed', 'exception']):
-                    logger.info(f"{name} output: {line.strip()}")
-        
-        # Check stderr
-        if process.stderr and select.select([process.stderr], [], [], 0.0)[0]:
-            line = process.stderr.readline()
-            if line:
-                # Filter out routine INFO messages that aren't actual errors
-                line_lower = line.lower()
-                if any(keyword in line_lower for keyword in ['error', 'warning', 'critical', 'failed', 'exception', 'traceback']):
-                    logger.error(f"{name} error: {line.strip()}")
-                elif any(keyword in line_lower for keyword in ['settings loaded successfully', 'settings saved successfully', 'settings file modified', 'forcing settings reload', 'updated bedtime']):
-                    # These are routine INFO messages, not errors - log at debug level or skip
-                    if not quiet_mode:
-                        logger.debug(f"{name} info: {line.strip()}")
-                elif any(keyword in line_lower for keyword in ['serving flask app', 'development server', 'production deployment', 'werkzeug', 'flask']):
-                    # These are Flask startup messages, not errors - log at debug level or skip
-                    if not quiet_mode:
-                        logger.debug(f"{name} flask: {line.strip()}")
-                else:
-                    # Other stderr messages - log as warnings in case they're important
-                    if not quiet_mode:
-                        logger.warning(f"{name} stderr: {line.strip()}")
-    except Exception as e:
-        logger.warning(f"Error monitoring {name} output: {e}")
+def monitor_output(quiet_mode=False, timeout=0):
+    """Log output from all started processes.
+    
+    One select call covers every registered stdout/stderr pipe.
+    
+    Args:
+        quiet_mode: Only log important messages
+        timeout: Seconds to wait for output (0 = don't block)
+    """
+    for key, _ in _output_selector.select(timeout=timeout):
+        name, stream_name = key.data
+        try:
+            try:
+                chunk = os.read(key.fd, OUTPUT_READ_SIZE)
+            except BlockingIOError:
+                continue
+            buffer = _output_buffers.setdefault(key.fd, bytearray())
+            if not chunk:
+                # EOF - the process closed this pipe, flush any partial line and stop watching it
+                _output_selector.unregister(key.fileobj)
+                del _output_buffers[key.fd]
+                if buffer:
+                    handle_output_line(name, stream_name, buffer.decode('utf-8', 'replace'), quiet_mode)
+                continue
+            
+            buffer += chunk
+            if b'\n' not in chunk:
+                continue
+            *lines, rest = buffer.split(b'\n')
+            _output_buffers[key.fd] = bytearray(rest)
+            for line in lines:
+                handle_output_line(name, stream_name, line.decode('utf-8', 'replace'), quiet_mode)
+        except Exception as e:
+            logger.warning(f"Error monitoring {name} output: {e}")
+
+def handle_output_line(name, stream_name, line, quiet_mode=False):
+    """Log one line of process output at a level based on its content."""
+    if stream_name == 'stdout':
+        # In quiet mode, only log important messages
+        if not quiet_mode or _STDOUT_IMPORTANT_RE.search(line):
+            logger.info(f"{name} output: {line.strip()}")
+        return
+    
+    # Filter out routine INFO messages that aren't actual errors
+    if _ERROR_RE.search(line):
+        logger.error(f"{name} error: {line.strip()}")
+    elif _INFO_RE.search(line):
+        # These are routine INFO messages, not errors - log at debug level or skip
+        if not quiet_mode:
+            logger.debug(f"{name} info: {line.strip()}")
+    elif _FLASK_RE.search(line):
+        # These are Flask startup messages, not errors - log at debug level or skip
+        if not quiet_mode:
+            logger.debug(f"{name} flask: {line.strip()}")
+    else:
+        # Other stderr messages - log as warnings in case they're important
+        if not quiet_mode:
+            logger.warning(f"{name} stderr: {line.strip()}")
 
 def check_process_health(process, name):
     """Check if a process is healthy without blocking."""
@@ -333,6 +431,13 @@ def check_process_health(process, name):
 def cleanup_processes(processes):
     """Cleanup processes on shutdown."""
     for name, process in processes.items():
+        if process:
+            for stream in (process.stdout, process.stderr):
+                try:
+                    key = _output_selector.unregister(stream)
+                    _output_buffers.pop(key.fd, None)
+                except (KeyError, ValueError):
+                    pass  # Already unregistered (EOF or earlier cleanup)
         if process and process.poll() is None:  # If process is still running
             logger.info(f"Stopping {name}...")
             process.terminate()
@@ -343,6 +448,29 @@ def cleanup_processes(processes):
                 process.kill()  # Force kill if it doesn't terminate
             logger.info(f"Stopped {name}")
 
+def get_web_interface_command():
+    """Build the command that serves the web interface.
+    
+    Returns:
+        list: Gunicorn command if Gunicorn is installed, else the Flask development server
+    """
+    if find_spec('gunicorn') is None:
+        logger.warning("Gunicorn not installed, using the Flask development server")
+        return [sys.executable, 'web_interface/app.py']
+    
+    return [
+        sys.executable, '-m', 'gunicorn',
+        '--workers', str(WEB_SERVER_WORKERS),
+        '--worker-class', 'gthread',
+        '--threads', str(WEB_SERVER_THREADS),
+        '--keep-alive', str(WEB_SERVER_KEEPALIVE_SECONDS),
+        # Finish in-flight requests within the window cleanup_processes waits before killing
+        '--graceful-timeout', str(PROCESS_TERMINATE_TIMEOUT_SECONDS - 1),
+        '--bind', f'0.0.0.0:{WEB_SERVER_PORT}',
+        '--log-level', 'warning',
+        'web_interface.wsgi:application',
+    ]
+
 def main():
     """Main function to start and monitor all processes."""
     processes = {}
@@ -351,7 +479,7 @@ def main():
     try:
         # Start web interface
         web_process = start_process(
-            [sys.executable, 'web_interface/app.py'],
+            get_web_interface_command(),
             'Web Interface'
         )
         if web_process:
@@ -384,23 +512,28 @@ def main():
         reset_reboot_count()
         
         # Monitor processes
+        last_health_check = 0.0
         while True:
-            # Check if either process has ended
-            for name, process in processes.items():
-                # Use the new health check function
-                is_healthy, error_msg = check_process_health(process, name)
-                if not is_healthy:
-                    logger.error(error_msg)
-                    log_detailed_error(name, process)
-                    cleanup_processes(processes)
-                    logger.info("Initiating system reboot...")
-                    system_reboot()
-                    sys.exit(1)  # Exit in case reboot fails
-                
-                # Monitor output (non-blocking) - use quiet mode after startup
-                monitor_output(process, name, quiet_mode=startup_complete)
+            # Health checks run every MONITOR_LOOP_INTERVAL_SECONDS regardless of output volume
+            now = time.monotonic()
+            if now - last_health_check >= MONITOR_LOOP_INTERVAL_SECONDS:
+                last_health_check = now
+                # Check if either process has ended
+                for name, process in processes.items():
+                    # Use the new health check function
+                    is_healthy, error_msg = check_process_health(process, name)
+                    if not is_healthy:
+                        logger.error(error_msg)
+                        log_detailed_error(name, process)
+                        cleanup_processes(processes)
+                        logger.info("Initiating system reboot...")
+                        system_reboot()
+                        sys.exit(1)  # Exit in case reboot fails
             
-            time.sleep(MONITOR_LOOP_INTERVAL_SECONDS)  # Check every second instead of every 0.1 seconds
+            # Block until a process writes output or the next health check is due,
+            # so log lines are handled immediately instead of after a fixed sleep
+            next_check_in = last_health_check + MONITOR_LOOP_INTERVAL_SECONDS - time.monotonic()
+            monitor_output(quiet_mode=startup_complete, timeout=max(0.0, next_check_in))
             
     except KeyboardInterrupt:
         logger.info("Received shutdown signal...")
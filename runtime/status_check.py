@@ -6,12 +6,35 @@ Quick command to check system status and display information
 
 import sys
 import os
-import json
+import functools
+import re
 import time
 from datetime import datetime
 
+try:
+    # C JSON parser when available (installed via setup.py)
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+try:
+    # Optional C ISO 8601 parser (pip install .[fast]); accepts a 'Z' suffix directly
+    from ciso8601 import parse_datetime
+except ImportError:
+    def parse_datetime(value):
+        """Parse an ISO 8601 timestamp, accepting a 'Z' UTC suffix."""
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+# DISPLAY_MODE value in .env, with optional surrounding quotes; \r is excluded for CRLF files
+_DISPLAY_MODE_RE = re.compile(r'^[ \t]*DISPLAY_MODE=["\']?([^"\'\r\n]*?)["\']?[ \t\r]*$', re.MULTILINE)
+
+# (icon, label) for a healthy/unhealthy flag
+_HEALTH_ICONS = {True: ("✅", "HEALTHY"), False: ("❌", "UNHEALTHY")}
+
+
+@functools.lru_cache(maxsize=1)
 def get_project_root():
-    """Get the project root directory based on this script's location."""
+    """Get the project root directory based on this script's location (computed once)."""
     # This script is in runtime/status_check.py, so go up one level to get project root
     script_dir = os.path.dirname(os.path.abspath(__file__))
     project_root = os.path.dirname(script_dir)
@@ -22,6 +45,7 @@ _project_root = get_project_root()
 if _project_root not in sys.path:
     sys.path.insert(0, _project_root)
 
+from monitoring.metrics import read_health_snapshot
 from monitoring.system_utils import format_uptime
 from config.constants import (
     METRICS_FILE_MAX_AGE_SECONDS,
@@ -42,47 +66,48 @@ def get_system_status():
     try:
         project_root = get_project_root()
         
-        # Read metrics file directly to avoid import issues
         metrics_file = os.path.join(project_root, 'logs', 'metrics.json')
-        if not os.path.exists(metrics_file):
-            return {
-                'error': 'Metrics file not found - system may not be running',
-                'healthy': False,
-                'active_vehicles': 0,
-                'display_mode': 'unknown',
-                'uptime': 0
-            }
-        
-        # Check if metrics file is stale (older than 2 minutes)
-        file_age = time.time() - os.path.getmtime(metrics_file)
-        metrics_stale = file_age > METRICS_FILE_MAX_AGE_SECONDS  # 2 minutes
         
-        with open(metrics_file, 'r') as f:
-            metrics_data = json.load(f)
+        # The writer's binary snapshot is refreshed every save cycle; metrics.json
+        # only every METRICS_JSON_SAVE_INTERVAL_SECONDS, so it is the fallback
+        snapshot = read_health_snapshot(metrics_file)
+        if snapshot is not None:
+            written_at, health_status = snapshot
+            file_age = time.time() - written_at
+        else:
+            try:
+                with open(metrics_file, 'r') as f:
+                    file_age = time.time() - os.fstat(f.fileno()).st_mtime
+                    metrics_data = json_loads(f.read())
+            except FileNotFoundError:
+                return {
+                    'error': 'Metrics file not found - system may not be running',
+                    'healthy': False,
+                    'active_vehicles': 0,
+                    'display_mode': 'unknown',
+                    'uptime': 0
+                }
+            health_status = metrics_data.get('health', {})
         
-        # Extract relevant information
-        health_status = metrics_data.get('health', {})
-        performance_metrics = metrics_data.get('performance', {})
+        # Check if the metrics are stale (older than 2 minutes)
+        metrics_stale = file_age > METRICS_FILE_MAX_AGE_SECONDS
         
         # Get current settings from .env file
         current_mode = 'unknown'
         last_settings_mod = 'unknown'
         env_file = os.path.join(project_root, '.env')
-        if os.path.exists(env_file):
-            try:
+        try:
+            with open(env_file, 'r') as f:
                 # Get last modification time
-                last_mod_time = os.path.getmtime(env_file)
+                last_mod_time = os.fstat(f.fileno()).st_mtime
                 last_settings_mod = datetime.fromtimestamp(last_mod_time).strftime('%Y-%m-%d %H:%M:%S')
                 
-                # Read display mode
-                with open(env_file, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line.startswith('DISPLAY_MODE='):
-                            current_mode = line.split('=', 1)[1].strip('"\'')
-                            break
-            except:
-                pass
+                # Read display mode (the file is small, so one read and one regex search)
+                match = _DISPLAY_MODE_RE.search(f.read())
+                if match:
+                    current_mode = match.group(1)
+        except:
+            pass
         
         return {
             'healthy': health_status.get('healthy', False),
@@ -139,8 +164,7 @@ def print_status():
         print()
     
     # Print health status
-    health_icon = "✅" if status['healthy'] else "❌"
-    health_text = "HEALTHY" if status['healthy'] else "UNHEALTHY"
+    health_icon, health_text = _HEALTH_ICONS[bool(status['healthy'])]
     print(f"{health_icon} System Status: {health_text}")
     
     # Print vehicle count and mode
@@ -155,10 +179,10 @@ def print_status():
     print(f"📅 Total Uptime: {total_uptime_text} (since first deployment)")
     
     # Print component health
-    api_icon = "✅" if status['api_healthy'] else "❌"
-    led_icon = "✅" if status['led_healthy'] else "❌"
-    print(f"{api_icon} API Health: {'HEALTHY' if status['api_healthy'] else 'UNHEALTHY'}")
-    print(f"{led_icon} LED Health: {'HEALTHY' if status['led_healthy'] else 'UNHEALTHY'}")
+    api_icon, api_text = _HEALTH_ICONS[bool(status['api_healthy'])]
+    led_icon, led_text = _HEALTH_ICONS[bool(status['led_healthy'])]
+    print(f"{api_icon} API Health: {api_text}")
+    print(f"{led_icon} LED Health: {led_text}")
     
     # Print system resources
     print()
@@ -200,31 +224,34 @@ def print_status():
     print("Timestamps:")
     
     # Print last update time
-    if status['last_led_update'] != 'unknown':
+    last_led_update = status['last_led_update']
+    if last_led_update != 'unknown':
         try:
             # Parse ISO timestamp and format like settings timestamp
-            led_timestamp = datetime.fromisoformat(status['last_led_update'].replace('Z', '+00:00'))
+            led_timestamp = parse_datetime(last_led_update)
             formatted_led_time = led_timestamp.strftime('%Y-%m-%d %H:%M:%S')
             print(f"🔄 Last LED Update: {formatted_led_time}")
         except:
             # Fallback to original format if parsing fails
-            print(f"🔄 Last LED Update: {status['last_led_update']}")
+            print(f"🔄 Last LED Update: {last_led_update}")
     
     # Print last settings modification
     if status['last_settings_mod'] != 'unknown':
         print(f"⚙️  Last Settings Change: {status['last_settings_mod']}")
     
     # Print start times
-    if status.get('session_start_time') != 'unknown':
+    session_start_time = status.get('session_start_time')
+    if session_start_time != 'unknown':
         try:
-            session_start = datetime.fromisoformat(status['session_start_time'].replace('Z', '+00:00'))
+            session_start = parse_datetime(session_start_time)
             print(f"🔄 Session Started: {session_start.strftime('%Y-%m-%d %H:%M:%S')}")
         except:
             pass
     
-    if status.get('first_start_time') != 'unknown':
+    first_start_time = status.get('first_start_time')
+    if first_start_time != 'unknown':
         try:
-            first_start = datetime.fromisoformat(status['first_start_time'].replace('Z', '+00:00'))
+            first_start = parse_datetime(first_start_time)
             print(f"🚀 First Deployed: {first_start.strftime('%Y-%m-%d %H:%M:%S')}")
         except:
             pass
@@ -6,7 +6,9 @@ setup(
     packages=find_packages(),
     install_requires=[
         "Flask>=2.0.0",
+        "gunicorn>=20.1",
         "requests>=2.25.0",
+        "orjson>=3.9",
         "sseclient>=0.0.27",
         "python-dotenv>=0.19.0",
         "rpi-ws281x>=4.3.0",
@@ -16,4 +18,10 @@ setup(
         "pytz>=2021.1",
         "RPi.GPIO",
     ],
+    extras_require={
+        # Optional C accelerators
+        "fast": [
+            "ciso8601>=2.3",
+        ],
+    },
 ) 
\ No newline at end of file
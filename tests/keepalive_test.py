@@ -22,6 +22,11 @@ I think it is a good enough approximation for now.
 import sys
 import os
 import time
+import asyncio
+import operator
+import socket
+import importlib.util
+from array import array
 from datetime import datetime, timedelta
 
 # Add project root to Python path
@@ -31,11 +36,61 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 import httpx
-import json
+import orjson
+
+# HTTP/2 needs the optional h2 package (pip install httpx[http2]); fall back to HTTP/1.1
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+# TCP keep-alive probes so a dead peer is noticed between MBTA's ~15-20s heartbeats
+_SOCKET_OPTIONS = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+if hasattr(socket, 'TCP_KEEPIDLE'):  # Linux-only options
+    _SOCKET_OPTIONS += [
+        (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30),
+        (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10),
+    ]
+
+# Event lines are written to stdout in batches at most this often
+OUTPUT_FLUSH_INTERVAL_SECONDS = 0.2
+
+# Compact JSON prefix of an object whose first key is a string "type"
+_TYPE_PROBE = b'{"type":"'
+
+# SSE field name -> slot in the pending [event_type, event_data] pair
+_SSE_FIELDS = {b'event': 0, b'data': 1}
+
+def _probe_type(payload: bytes):
+    """Read the "type" of a JSON object payload without parsing it.
+    
+    Only trusted when "type" is the object's first key, which makes it the
+    top-level one; JSON:API resources also carry "type" inside their
+    relationships, so any other layout needs a real parse.
+    
+    Args:
+        payload: Raw SSE data payload
+        
+    Returns:
+        str type, or None if the caller should parse the payload
+    """
+    if not payload.startswith(_TYPE_PROBE) or not payload.rstrip().endswith(b'}'):
+        return None
+    start = len(_TYPE_PROBE)
+    end = payload.find(b'"', start)
+    if end < 0 or b'\\' in payload[start:end]:
+        return None  # Unterminated or escaped value
+    return payload[start:end].decode('utf-8', 'replace')
+
 
 class KeepAliveMonitor:
     """Monitor keep-alive events from MBTA SSE stream."""
     
+    # Fixed attribute set: slot access is cheaper than a __dict__ lookup on the per-event path
+    __slots__ = (
+        'api_key', 'route',
+        'event_times', 'keepalive_times', 'data_event_times',
+        'event_count', 'keepalive_count', 'data_event_count', 'last_event_time',
+        '_output', '_ts_second', '_ts_prefix',
+    )
+    
     def __init__(self, api_key: str, route: str = "NonExistentRoute"):
         """Initialize the monitor.
         
@@ -45,11 +100,19 @@ class KeepAliveMonitor:
         """
         self.api_key = api_key
         self.route = route
-        self.event_times = []
-        self.keepalive_times = []
-        self.data_event_times = []
+        # Timestamps as packed C doubles rather than lists of float objects
+        self.event_times = array('d')
+        self.keepalive_times = array('d')
+        self.data_event_times = array('d')
+        self.event_count = 0
+        self.keepalive_count = 0
+        self.data_event_count = 0
+        self.last_event_time = 0.0
+        self._output = None  # asyncio.Queue of lines for the printer task, created in run()
+        self._ts_second = -1  # Whole second the cached "HH:MM:SS" prefix belongs to
+        self._ts_prefix = ''
     
-    def run(self, duration_seconds: int = 300):
+    async def run(self, duration_seconds: int = 300):
         """Run the monitor for specified duration.
         
         Args:
@@ -70,113 +133,191 @@ class KeepAliveMonitor:
         print(f"Route: {self.route}")
         print(f"Duration: {duration_seconds} seconds")
         print(f"Start time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"{'='*70}\n")
+        print(f"{'='*70}\n", flush=True)
         
         start_time = time.time()
-        last_event_time = start_time
-        event_count = 0
-        keepalive_count = 0
-        data_event_count = 0
+        self.last_event_time = start_time
+        
+        # Printing happens in a separate task so a slow terminal never stalls the reader
+        self._output = asyncio.Queue()
+        printer = asyncio.create_task(self._print_output())
         
         try:
-            print(f"Connecting to MBTA SSE stream...")
-            
-            # Set timeout to 60 seconds to handle ~15-20 second keep-alive intervals
-            timeout = httpx.Timeout(60.0, connect=10.0)
+            await asyncio.wait_for(self._read_stream(url, headers, params), timeout=duration_seconds)
+        except asyncio.TimeoutError:
+            self._output.put_nowait(f"\n{'='*70}")
+            self._output.put_nowait(f"Duration limit reached ({duration_seconds}s). Stopping...")
+            self._output.put_nowait(f"{'='*70}")
+        except asyncio.CancelledError:
+            # asyncio.run() cancels the task on Ctrl+C
+            self._output.put_nowait(f"\n{'='*70}")
+            self._output.put_nowait("Monitoring stopped by user (Ctrl+C)")
+            self._output.put_nowait(f"{'='*70}")
+        except Exception as e:
+            self._output.put_nowait(f"\n{'='*70}")
+            self._output.put_nowait(f"Error: {e}")
+            self._output.put_nowait(f"{'='*70}")
+        finally:
+            end_time = time.time()
+            await self._output.join()
+            printer.cancel()
+        
+        # Print statistics
+        self.print_statistics(start_time, end_time, self.event_count,
+                              self.keepalive_count, self.data_event_count)
+    
+    async def _print_output(self):
+        """Write queued output lines to stdout in batches until cancelled.
+        
+        Lines arriving within OUTPUT_FLUSH_INTERVAL_SECONDS of each other go out
+        in one write and flush instead of one print() per event.
+        """
+        output = self._output
+        write, flush = sys.stdout.write, sys.stdout.flush
+        while True:
+            lines = [await output.get()]
+            await asyncio.sleep(OUTPUT_FLUSH_INTERVAL_SECONDS)
+            while not output.empty():
+                lines.append(output.get_nowait())
+            write('\n'.join(lines) + '\n')
+            flush()
+            for _ in lines:
+                output.task_done()
+    
+    def _format_timestamp(self, current_time: float) -> str:
+        """Format a time.time() value as HH:MM:SS.mmm.
+        
+        The HH:MM:SS part is reused for every event within the same second.
+        
+        Args:
+            current_time: Seconds since the epoch
             
-            with httpx.Client(timeout=timeout) as client:
-                with client.stream("GET", url, headers=headers, params=params) as response:
-                    response.raise_for_status()
-                    print(f"Connected! Monitoring events...\n")
-                    
-                    # Parse SSE stream manually to capture comment lines (keep-alives)
-                    event_type = None
-                    event_data = None
-                    
-                    for line in response.iter_lines():
-                        current_time = time.time()
-                        
-                        # Check if duration exceeded
-                        if current_time - start_time >= duration_seconds:
-                            print(f"\n{'='*70}")
-                            print(f"Duration limit reached ({duration_seconds}s). Stopping...")
-                            print(f"{'='*70}")
+        Returns:
+            str: Local time with milliseconds
+        """
+        second = int(current_time)
+        if second != self._ts_second:
+            lt = time.localtime(second)
+            self._ts_prefix = f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}"
+            self._ts_second = second
+        return f"{self._ts_prefix}.{int((current_time - second) * 1000):03d}"
+    
+    async def _read_stream(self, url: str, headers: dict, params: dict):
+        """Connect to the SSE stream and record events until cancelled.
+        
+        Args:
+            url: SSE endpoint URL
+            headers: Request headers
+            params: Query parameters
+        """
+        self._output.put_nowait(f"Connecting to MBTA SSE stream...")
+        
+        # Set timeout to 60 seconds to handle ~15-20 second keep-alive intervals
+        timeout = httpx.Timeout(60.0, connect=10.0)
+        transport = httpx.AsyncHTTPTransport(
+            http2=HTTP2_AVAILABLE,
+            retries=3,  # Connection attempts only; the stream itself is never replayed
+            limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=120),
+            socket_options=_SOCKET_OPTIONS
+        )
+        
+        async with httpx.AsyncClient(timeout=timeout, transport=transport) as client:
+            async with client.stream("GET", url, headers=headers, params=params) as response:
+                response.raise_for_status()
+                self._output.put_nowait(f"Connected over {response.http_version}! Monitoring events...\n")
+                
+                # Parse SSE stream manually to capture comment lines (keep-alives)
+                pending = [None, None]  # event_type, event_data
+                
+                # Local bindings for the per-line hot path
+                now = time.time
+                record_event = self.event_times.append
+                record_keepalive = self.keepalive_times.append
+                record_data = self.data_event_times.append
+                emit = self._output.put_nowait
+                fields = _SSE_FIELDS
+                
+                # Lines are split out of raw bytes; only what gets printed or parsed is decoded.
+                # No chunk_size: httpx would hold data back until that many bytes arrive.
+                buf = bytearray()
+                async for chunk in response.aiter_bytes():
+                    buf += chunk
+                    start = 0
+                    while True:
+                        end = buf.find(b'\n', start)
+                        if end < 0:
                             break
+                        line = buf[start:end]
+                        start = end + 1
+                        if line[-1:] == b'\r':
+                            line = line[:-1]
+                        current_time = now()
                         
                         # Empty line marks end of a data event
-                        if line == '':
+                        if not line:
+                            event_type, event_data = pending
                             if event_type is not None or event_data is not None:
                                 # We have a complete data event
-                                event_count += 1
-                                data_event_count += 1
-                                time_since_last = current_time - last_event_time
+                                self.event_count += 1
+                                self.data_event_count += 1
+                                time_since_last = current_time - self.last_event_time
                                 
-                                self.data_event_times.append(current_time)
-                                self.event_times.append(current_time)
+                                record_data(current_time)
+                                record_event(current_time)
                                 
-                                timestamp = datetime.now().strftime('%H:%M:%S.%f')[:-3]
+                                timestamp = self._format_timestamp(current_time)
                                 
                                 # Try to parse data
                                 data_info = ""
-                                if event_data:
+                                data_type = _probe_type(event_data) if event_data else None
+                                if data_type is not None:
+                                    data_info = f", data_type='{data_type}'"
+                                elif event_data:
                                     try:
-                                        data = json.loads(event_data)
+                                        data = orjson.loads(event_data)
                                         if isinstance(data, dict):
                                             data_type = data.get('type', 'unknown')
                                             data_info = f", data_type='{data_type}'"
                                         elif isinstance(data, list):
                                             data_info = f", data_type='list', count={len(data)}"
-                                    except (json.JSONDecodeError, Exception):
+                                    except orjson.JSONDecodeError:
                                         data_info = ", data_type='unparseable'"
                                 
-                                print(f"[{timestamp}] Event #{event_count:4d} | DATA         | "
-                                      f"Δt: {time_since_last:6.2f}s | event='{event_type}'{data_info}")
+                                event_name = event_type.decode('utf-8', 'replace') if event_type is not None else None
+                                emit(f"[{timestamp}] Event #{self.event_count:4d} | DATA         | "
+                                     f"Δt: {time_since_last:6.2f}s | event='{event_name}'{data_info}")
                                 
-                                last_event_time = current_time
+                                self.last_event_time = current_time
                                 
                                 # Reset for next event
-                                event_type = None
-                                event_data = None
+                                pending[0] = pending[1] = None
                             continue
                         
-                        # Check for comment lines (keep-alive) - these start with ':'
-                        if line.startswith(':'):
-                            event_count += 1
-                            keepalive_count += 1
-                            time_since_last = current_time - last_event_time
+                        field, _, value = line.partition(b':')
+                        
+                        # Comment lines (keep-alive) start with ':', so the field name is empty
+                        if not field:
+                            self.event_count += 1
+                            self.keepalive_count += 1
+                            time_since_last = current_time - self.last_event_time
                             
-                            self.keepalive_times.append(current_time)
-                            self.event_times.append(current_time)
+                            record_keepalive(current_time)
+                            record_event(current_time)
                             
-                            timestamp = datetime.now().strftime('%H:%M:%S.%f')[:-3]
-                            comment = line[1:].strip()  # Remove ':' and trim whitespace
-                            print(f"[{timestamp}] Event #{event_count:4d} | KEEP-ALIVE   | "
-                                  f"Δt: {time_since_last:6.2f}s | comment='{comment}'")
+                            timestamp = self._format_timestamp(current_time)
+                            emit(f"[{timestamp}] Event #{self.event_count:4d} | KEEP-ALIVE   | "
+                                 f"Δt: {time_since_last:6.2f}s | comment='{value.strip().decode('utf-8', 'replace')}'")
                             
-                            last_event_time = current_time
+                            self.last_event_time = current_time
                             continue
                         
-                        # Parse event field
-                        if line.startswith('event:'):
-                            event_type = line[6:].strip()
-                            continue
-                        
-                        # Parse data field
-                        if line.startswith('data:'):
-                            event_data = line[5:].strip()
-                            continue
+                        # event: / data: fields
+                        slot = fields.get(bytes(field))
+                        if slot is not None:
+                            pending[slot] = bytes(value.strip())
                     
-        except KeyboardInterrupt:
-            print(f"\n{'='*70}")
-            print("Monitoring stopped by user (Ctrl+C)")
-            print(f"{'='*70}")
-        except Exception as e:
-            print(f"\n{'='*70}")
-            print(f"Error: {e}")
-            print(f"{'='*70}")
-        
-        # Print statistics
-        self.print_statistics(start_time, time.time(), event_count, keepalive_count, data_event_count)
+                    # Drop the consumed lines, keeping any partial line for the next chunk
+                    del buf[:start]
     
     def print_statistics(self, start_time: float, end_time: float, 
                         event_count: int, keepalive_count: int, data_event_count: int):
@@ -197,13 +338,7 @@ class KeepAliveMonitor:
         
         # Keep-alive intervals
         if len(self.keepalive_times) > 1:
-            keepalive_intervals = [
-                self.keepalive_times[i] - self.keepalive_times[i-1] 
-                for i in range(1, len(self.keepalive_times))
-            ]
-            avg_keepalive = sum(keepalive_intervals) / len(keepalive_intervals)
-            min_keepalive = min(keepalive_intervals)
-            max_keepalive = max(keepalive_intervals)
+            avg_keepalive, min_keepalive, max_keepalive = self._interval_stats(self.keepalive_times)
             
             print(f"\nKeep-Alive Timing:")
             print(f"  Average Interval:    {avg_keepalive:.2f} seconds")
@@ -212,13 +347,7 @@ class KeepAliveMonitor:
         
         # Data event intervals
         if len(self.data_event_times) > 1:
-            data_intervals = [
-                self.data_event_times[i] - self.data_event_times[i-1] 
-                for i in range(1, len(self.data_event_times))
-            ]
-            avg_data = sum(data_intervals) / len(data_intervals)
-            min_data = min(data_intervals)
-            max_data = max(data_intervals)
+            avg_data, min_data, max_data = self._interval_stats(self.data_event_times)
             
             print(f"\nData Event Timing:")
             print(f"  Average Interval:    {avg_data:.2f} seconds")
@@ -226,6 +355,23 @@ class KeepAliveMonitor:
             print(f"  Max Interval:        {max_data:.2f} seconds")
         
         print(f"{'='*70}\n")
+    
+    @staticmethod
+    def _interval_stats(times: array) -> tuple:
+        """Get (average, min, max) of the gaps between consecutive timestamps.
+        
+        Args:
+            times: At least two increasing timestamps
+            
+        Returns:
+            tuple: (average, min, max) interval in seconds
+        """
+        # The intervals telescope, so the average needs only the endpoints; min/max
+        # stream over the pairwise differences without building a list
+        avg = (times[-1] - times[0]) / (len(times) - 1)
+        return (avg,
+                min(map(operator.sub, times[1:], times[:-1])),
+                max(map(operator.sub, times[1:], times[:-1])))
 
 
 def main():
@@ -261,9 +407,15 @@ def main():
         print("  Get a free API key at: https://api-v3.mbta.com/")
         print("  The test will continue but may be rate-limited.\n")
     
+    # The monitor batches its own output, so don't flush on every newline
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    
     # Create and run monitor
     monitor = KeepAliveMonitor(api_key, route)
-    monitor.run(duration)
+    try:
+        asyncio.run(monitor.run(duration))
+    except KeyboardInterrupt:
+        pass  # run() already reported the interruption and printed statistics
 
 
 if __name__ == "__main__":
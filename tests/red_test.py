@@ -6,7 +6,33 @@ This script can be run independently to test LED functionality.
 
 import board
 import neopixel
-import time
+import signal
+
+# Colors as raw bytes in the strip's GRB wire order
+RED_GRB = b'\x00\xff\x00'
+OFF_GRB = b'\x00\x00\x00'
+
+
+def fill_solid(pixels, led_count, grb):
+    """Set every pixel to one color with a single buffer write, then show it.
+    
+    Writes the driver's pixel buffer directly when it holds plain GRB bytes at
+    full brightness; otherwise falls back to the per-pixel fill().
+    
+    Args:
+        pixels: NeoPixel strip
+        led_count: Number of LEDs on the strip (47/27/43/131 per line)
+        grb: 3-byte color in GRB order
+    """
+    frame = grb * led_count
+    buf = getattr(pixels, '_post_brightness_buffer', None)
+    if (buf is not None and len(buf) == len(frame) and pixels.brightness == 1.0
+            and getattr(pixels, '_pre_brightness_buffer', None) is None):
+        buf[:] = frame
+    else:
+        pixels.fill((grb[1], grb[0], grb[2]))  # fill() takes RGB
+    pixels.show()
+
 
 def set_leds_to_red():
     """Turn all LEDs on pin 28 to red color."""
@@ -40,21 +66,18 @@ def set_leds_to_red():
         
         # Set all LEDs to red
         print("Setting all LEDs to red...")
-        red_color = (255, 0, 0)  # Red in RGB format
-        pixels.fill(red_color)
-        pixels.show()
+        fill_solid(pixels, LED_COUNT, RED_GRB)
         
         print(f"Successfully set {LED_COUNT} LEDs to red!")
         print("Press Ctrl+C to exit...")
         
-        # Keep the LEDs on until interrupted
+        # Keep the LEDs on until interrupted (sleeps until a signal arrives)
         while True:
-            time.sleep(1)
+            signal.pause()
             
     except KeyboardInterrupt:
         print("\nTurning off all LEDs...")
-        pixels.fill((0, 0, 0))  # Turn off all LEDs
-        pixels.show()
+        fill_solid(pixels, LED_COUNT, OFF_GRB)  # Turn off all LEDs
         print("All LEDs turned off. Goodbye!")
         
     except Exception as e:
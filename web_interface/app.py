@@ -8,14 +8,25 @@ project_root = os.path.dirname(current_dir)
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from flask import Flask, request, jsonify, render_template
+from flask import Flask, Response, request, render_template
+import orjson
 from config.settings import SettingsManager
 from config.validation import DEFAULT_SETTINGS
 from monitoring.metrics import SystemMetrics
 from monitoring.system_utils import format_uptime
 from config.station_id_maps import station_id_maps
-from config.constants import API_KEY_MIN_LENGTH, WEB_SERVER_PORT
+from config.constants import (
+    API_KEY_MIN_LENGTH,
+    WEB_SERVER_PORT,
+    WEB_METRICS_CACHE_TTL_SECONDS,
+    WEB_STATUS_STREAM_INTERVAL_SECONDS,
+    WEB_STATUS_STREAM_MAX_SECONDS,
+    WEB_STATUS_STREAM_MAX_CLIENTS,
+    WEB_STATUS_STREAM_RETRY_MS,
+)
 import logging
+import threading
+import time
 from datetime import datetime
 
 # Configure logging
@@ -32,121 +43,238 @@ app = Flask(__name__, template_folder='templates')
 logging.getLogger('werkzeug').setLevel(logging.ERROR)
 logging.getLogger('flask').setLevel(logging.ERROR)
 
+def ojsonify(obj, status: int = 200):
+    """Build a JSON response with orjson instead of Flask's stdlib-json jsonify.
+    
+    Args:
+        obj: JSON-serializable object
+        status: HTTP status code
+        
+    Returns:
+        Response: application/json response
+    """
+    return app.response_class(orjson.dumps(obj), status=status, mimetype='application/json')
+
 settings_manager = SettingsManager()
 metrics = SystemMetrics(is_writer=False)  # Website reads from shared metrics file
 
+# Last (monotonic time, health, performance) read, shared by the metrics endpoints
+_metrics_cache = (float('-inf'), None, None)
+_metrics_cache_lock = threading.Lock()
+
+def get_cached_metrics():
+    """Get health and performance metrics, reusing a read from the last TTL window.
+    
+    Returns:
+        tuple: (health status dict, performance metrics dict)
+    """
+    global _metrics_cache
+    with _metrics_cache_lock:
+        now = time.monotonic()
+        if now - _metrics_cache[0] > WEB_METRICS_CACHE_TTL_SECONDS:
+            _metrics_cache = (now, metrics.get_health_status(), metrics.get_performance_metrics())
+        return _metrics_cache[1], _metrics_cache[2]
+
 @app.route('/health')
 def health_check():
     """Health check endpoint."""
     try:
-        health_status = metrics.get_health_status()
+        health_status, _ = get_cached_metrics()
         status_code = 200 if health_status['healthy'] else 503
-        return jsonify(health_status), status_code
+        return ojsonify(health_status, status_code)
     except Exception as e:
         logger.error(f"Health check failed: {e}")
-        return jsonify({
+        return ojsonify({
             'healthy': False,
             'error': str(e)
-        }), 500
+        }, 500)
 
 @app.route('/metrics')
 def get_metrics():
     """Get system metrics."""
     try:
-        return jsonify({
-            'health': metrics.get_health_status(),
-            'performance': metrics.get_performance_metrics()
+        health_status, performance_metrics = get_cached_metrics()
+        return ojsonify({
+            'health': health_status,
+            'performance': performance_metrics
         })
     except Exception as e:
         logger.error(f"Failed to get metrics: {e}")
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}, 500)
 
 # Station tracking endpoints removed for stable version
 
+def build_system_status():
+    """Build the system status shown in the web interface.
+    
+    Returns:
+        dict: Overall health, uptimes, resource usage and per-component status
+    """
+    health_status, performance_metrics = get_cached_metrics()
+    
+    # Format uptimes for display using shared utility
+    session_uptime_str = format_uptime(health_status.get('session_uptime_seconds', 0))
+    total_uptime_str = format_uptime(health_status.get('total_uptime_seconds', 0))
+    
+    # Determine overall system health
+    overall_healthy = health_status.get('healthy', False)
+    
+    # Check individual component health
+    api_healthy = health_status.get('api_healthy', False)
+    led_healthy = health_status.get('led_healthy', False)
+    
+    # Create detailed status
+    return {
+        'overall_healthy': overall_healthy,
+        'session_uptime': session_uptime_str,
+        'total_uptime': total_uptime_str,
+        'session_start_time': health_status.get('session_start_time', 'Unknown'),
+        'first_start_time': health_status.get('first_start_time', 'Unknown'),
+        'active_vehicles': health_status.get('active_vehicles', 0),
+        'display_mode': health_status.get('display_mode', 'Unknown'),
+        'last_led_update': health_status.get('last_led_update', 'Unknown'),
+        'last_api_success': health_status.get('last_api_success', 'Unknown'),
+        'memory_usage': health_status.get('memory_usage'),
+        'cpu_temperature': health_status.get('cpu_temperature'),
+        'components': {
+            'api': {
+                'healthy': api_healthy,
+                'status': 'Healthy' if api_healthy else 'Unhealthy',
+                'details': 'MBTA API connection working' if api_healthy else 'MBTA API connection issues'
+            },
+            'led': {
+                'healthy': led_healthy,
+                'status': 'Healthy' if led_healthy else 'Unhealthy',
+                'details': 'LED display working' if led_healthy else 'LED display issues'
+            }
+        },
+        'last_check': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    }
+
+def system_status_error(e):
+    """Build the status payload reported when the system status can't be read.
+    
+    Args:
+        e: Exception raised while building the status
+        
+    Returns:
+        dict: Unhealthy status carrying the error message
+    """
+    return {
+        'overall_healthy': False,
+        'error': str(e),
+        'components': {
+            'api': {'healthy': False, 'status': 'Error', 'details': 'Unable to check status'},
+            'led': {'healthy': False, 'status': 'Error', 'details': 'Unable to check status'}
+        }
+    }
+
 @app.route('/system_status')
 def get_system_status():
     """Get system status for web interface display."""
     try:
-        health_status = metrics.get_health_status()
-        performance_metrics = metrics.get_performance_metrics()
-        
-        # Format uptimes for display using shared utility
-        session_uptime_str = format_uptime(health_status.get('session_uptime_seconds', 0))
-        total_uptime_str = format_uptime(health_status.get('total_uptime_seconds', 0))
+        return ojsonify(build_system_status())
+    except Exception as e:
+        logger.error(f"Failed to get system status: {e}")
+        return ojsonify(system_status_error(e), 500)
+
+# Slots for concurrent /status_stream clients in this worker process
+_status_stream_slots = threading.BoundedSemaphore(WEB_STATUS_STREAM_MAX_CLIENTS)
+
+@app.route('/status_stream')
+def status_stream():
+    """Push the system status to the web interface as Server-Sent Events.
+    
+    An event is sent whenever the status changes and a keep-alive comment on
+    every other tick, so a closed tab fails its next write within a second.
+    Streams end after WEB_STATUS_STREAM_MAX_SECONDS and the browser reconnects;
+    once WEB_STATUS_STREAM_MAX_CLIENTS are open, further clients get a 503 and
+    fall back to polling /system_status.
+    """
+    if not _status_stream_slots.acquire(blocking=False):
+        return ojsonify({'error': 'Too many status streams, poll /system_status instead'}, 503)
+    
+    def generate():
+        yield f'retry: {WEB_STATUS_STREAM_RETRY_MS}\n\n'.encode()
+        last_status = None
+        deadline = time.monotonic() + WEB_STATUS_STREAM_MAX_SECONDS
+        while time.monotonic() < deadline:
+            try:
+                status = build_system_status()
+            except Exception as e:
+                logger.error(f"Failed to get system status: {e}")
+                status = system_status_error(e)
+            
+            # last_check changes every second, so leave it out of the comparison
+            last_check = status.pop('last_check', None)
+            if status != last_status:
+                last_status = dict(status)
+                if last_check is not None:
+                    status['last_check'] = last_check
+                yield b'data: ' + orjson.dumps(status) + b'\n\n'
+            else:
+                yield b': keep-alive\n\n'
+            
+            time.sleep(WEB_STATUS_STREAM_INTERVAL_SECONDS)
+    
+    response = Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'  # Stop nginx from buffering the stream
+    })
+    # Runs when the server closes the response, even if the generator never started
+    response.call_on_close(_status_stream_slots.release)
+    return response
+
+# (settings version, template view, API view), rebuilt only when the settings version
+# changes and replaced as one tuple so threads never see views from different versions
+_settings_views = (None, {}, {})
+
+def get_settings_views(settings, version):
+    """Get the template and API views of the settings, cached per settings version.
+    
+    Args:
+        settings: Settings dictionary as returned by the settings manager
+        version: Settings version the dictionary was loaded at
         
-        # Determine overall system health
-        overall_healthy = health_status.get('healthy', False)
+    Returns:
+        tuple: (template_settings, response_settings) copies safe to modify
+    """
+    global _settings_views
+    views = _settings_views
+    if views[0] != version:
+        # Convert settings keys to uppercase to match the template and frontend expectations
+        response_settings = {k.upper(): v for k, v in settings.items()}
         
-        # Check individual component health
-        api_healthy = health_status.get('api_healthy', False)
-        led_healthy = health_status.get('led_healthy', False)
+        # Mask the API key if it exists
+        if 'MBTA_API_KEY' in response_settings:
+            response_settings['MBTA_API_KEY'] = '********' if response_settings['MBTA_API_KEY'] else ''
         
-        # Create detailed status
-        system_status = {
-            'overall_healthy': overall_healthy,
-            'session_uptime': session_uptime_str,
-            'total_uptime': total_uptime_str,
-            'session_start_time': health_status.get('session_start_time', 'Unknown'),
-            'first_start_time': health_status.get('first_start_time', 'Unknown'),
-            'active_vehicles': health_status.get('active_vehicles', 0),
-            'display_mode': health_status.get('display_mode', 'Unknown'),
-            'last_led_update': health_status.get('last_led_update', 'Unknown'),
-            'last_api_success': health_status.get('last_api_success', 'Unknown'),
-            'memory_usage': health_status.get('memory_usage'),
-            'cpu_temperature': health_status.get('cpu_temperature'),
-            'components': {
-                'api': {
-                    'healthy': api_healthy,
-                    'status': 'Healthy' if api_healthy else 'Unhealthy',
-                    'details': 'MBTA API connection working' if api_healthy else 'MBTA API connection issues'
-                },
-                'led': {
-                    'healthy': led_healthy,
-                    'status': 'Healthy' if led_healthy else 'Unhealthy',
-                    'details': 'LED display working' if led_healthy else 'LED display issues'
-                }
-            },
-            'last_check': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        }
+        # Update the template settings to include the rainbow mode and display mode
+        template_settings = dict(response_settings)
+        template_settings['RAINBOW_MODE'] = settings.get('rainbow_mode', 'off')
+        template_settings['DISPLAY_MODE'] = settings.get('display_mode', 'vehicles')
+        template_settings['SHOW_DEBUGGER_OPTIONS'] = settings.get('show_debugger_options', False)
         
-        return jsonify(system_status)
-    except Exception as e:
-        logger.error(f"Failed to get system status: {e}")
-        return jsonify({
-            'overall_healthy': False,
-            'error': str(e),
-            'components': {
-                'api': {'healthy': False, 'status': 'Error', 'details': 'Unable to check status'},
-                'led': {'healthy': False, 'status': 'Error', 'details': 'Unable to check status'}
-            }
-        }), 500
+        views = _settings_views = (version, template_settings, response_settings)
+    
+    return dict(views[1]), dict(views[2])
 
 @app.route('/')
 def index():
     try:
-        # Force reload to ensure we get the most current settings
-        # This prevents issues with cached environment variables
-        settings = settings_manager.force_reload()
+        # Re-parsed only when the .env file has changed since the last request
+        settings, version = settings_manager.get_versioned_settings()
             
         # If settings is empty, try to load defaults or show error
         if not settings:
             logger.warning("No settings found, attempting to load defaults")
             settings = settings_manager.get_default_settings()
+            version = -1  # Never matches a real version, so these views aren't reused for it
             if not settings:
                 logger.error("No default settings available")
                 settings = {}
         
-        # Convert settings keys to uppercase to match the template expectations
-        template_settings = {k.upper(): v for k, v in settings.items()}
-        
-        # Mask the API key if it exists
-        if 'MBTA_API_KEY' in template_settings:
-            template_settings['MBTA_API_KEY'] = '********' if template_settings['MBTA_API_KEY'] else ''
-            
-        # Update the template settings to include the rainbow mode and display mode
-        template_settings['RAINBOW_MODE'] = settings.get('rainbow_mode', 'off')
-        template_settings['DISPLAY_MODE'] = settings.get('display_mode', 'vehicles')
-        template_settings['SHOW_DEBUGGER_OPTIONS'] = settings.get('show_debugger_options', False)
+        template_settings, _ = get_settings_views(settings, version)
         
         return render_template('index.html', settings=template_settings)
     except Exception as e:
@@ -166,19 +294,18 @@ def save_settings_route():
         
         # Handle API key preservation - only update if a valid new key is provided
         api_key = storage_settings.get('mbta_api_key', '')
+        # The masked '********', '', 'None' and other too-short keys all fail the length
+        # check, so strip() only runs for long keys padded with whitespace
         should_preserve_existing = (
-            api_key == '********' or  # Masked key from frontend
-            api_key == '' or          # Empty string
-            api_key is None or        # None value
-            api_key == 'None' or      # String 'None'
-            (isinstance(api_key, str) and len(api_key.strip()) < API_KEY_MIN_LENGTH)  # Too short to be valid
+            not isinstance(api_key, str) or               # None or a non-string value
+            len(api_key) < API_KEY_MIN_LENGTH or          # Too short to be valid
+            ((api_key[0].isspace() or api_key[-1].isspace()) and
+             len(api_key.strip()) < API_KEY_MIN_LENGTH)   # Only long because of padding
         )
         
         if should_preserve_existing:
             # Get current settings to preserve existing API key
-            current_settings = settings_manager.check_and_reload()
-            if current_settings is None:
-                current_settings = settings_manager.load_settings()
+            current_settings = settings_manager.get_current_settings()
             
             if current_settings and current_settings.get('mbta_api_key'):
                 storage_settings['mbta_api_key'] = current_settings['mbta_api_key']
@@ -187,35 +314,26 @@ def save_settings_route():
                 storage_settings['mbta_api_key'] = None
         
         # Save all settings to the configuration file
+        # Saving invalidates the cached settings, so the next GET sees the new values
         settings_manager.save_settings(storage_settings)
         
-        # Force reload to ensure the new settings are immediately available
-        # This prevents caching issues with python-decouple
-        settings_manager.force_reload()
-        
-        return jsonify(message='Settings saved!')
+        return ojsonify({'message': 'Settings saved!'})
     except Exception as e:
         logger.error(f"Error saving settings: {e}", exc_info=True)
-        return jsonify(message=f'Error saving settings: {str(e)}'), 500
+        return ojsonify({'message': f'Error saving settings: {str(e)}'}, 500)
 
 @app.route('/get_settings', methods=['GET'])
 def get_settings():
     try:
-        # Force reload to ensure we get the most current settings
-        # This prevents issues with cached environment variables
-        settings = settings_manager.force_reload()
-            
-        # Convert settings keys to uppercase for consistency with frontend
-        response_settings = {k.upper(): v for k, v in settings.items()}
+        # Re-parsed only when the .env file has changed since the last request
+        settings, version = settings_manager.get_versioned_settings()
         
-        # Mask the API key if it exists
-        if 'MBTA_API_KEY' in response_settings:
-            response_settings['MBTA_API_KEY'] = '********' if response_settings['MBTA_API_KEY'] else ''
-            
-        return jsonify(response_settings)
+        _, response_settings = get_settings_views(settings, version)
+        
+        return ojsonify(response_settings)
     except Exception as e:
         logger.error(f"Error loading settings: {e}", exc_info=True)
-        return jsonify(message=f'Error loading settings: {str(e)}'), 500
+        return ojsonify({'message': f'Error loading settings: {str(e)}'}, 500)
 
 if __name__ == '__main__':
     # Reduce Flask output noise
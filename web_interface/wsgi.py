@@ -0,0 +1,9 @@
+"""WSGI entry point for serving the web interface with Gunicorn.
+
+Run from the project root, e.g.:
+    gunicorn -w 2 -k gthread --threads 4 --keep-alive 30 -b 0.0.0.0:8000 web_interface.wsgi:application
+
+runtime/startup.py launches it this way when Gunicorn is installed; running
+web_interface/app.py directly still starts the Flask development server.
+"""
+from web_interface.app import app as application